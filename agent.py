@@ -10,34 +10,54 @@ Handles:
 """
 
 import asyncio
-import json
+import itertools
 import logging
+import time
+
+import aiosqlite
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Optional
 from datetime import datetime
 
 from config.settings import Settings
-from config.prompts import build_system_prompt
+from config.prompts import build_static_system_prompt, build_dynamic_context
+import json_io
+from agent_models import get_tokenizer
 from memory.memory import MemoryStore
+from memory.semantic_cache import SemanticCache
 from tools.tool_registry import ToolRegistry
 from tools.tool_executor import ToolExecutor
 
 logger = logging.getLogger("MAX.agent")
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     role: str  # "user" | "assistant" | "tool_result"
-    content: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    # Plain text for user/assistant turns; raw dict payloads for tool calls
+    # and results, serialized lazily (and only once) at the provider boundary
+    content: Any
+    # Unix seconds — a plain float is far cheaper to allocate than a
+    # datetime, and messages are created three times per tool iteration
+    timestamp: float = field(default_factory=time.time)
     metadata: dict = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class LLMReply:
+    """Structured LLM result — avoids round-tripping tool calls through JSON."""
+    text: str = ""
+    tool_calls: list[dict] = field(default_factory=list)
+
+
 @dataclass
 class AgentResponse:
     text: str
     actions_taken: list[str] = field(default_factory=list)
     memories_used: list[str] = field(default_factory=list)
+    cache_tokens_read: int = 0
+    cache_tokens_written: int = 0
     error: Optional[str] = None
 
 
@@ -56,42 +76,92 @@ class MAXAgent:
     """
 
     MAX_ITERATIONS = 15  # Safety limit on tool call loops
+    JOURNAL_FLUSH_EVERY = 8  # Batch this many messages per journal write
     COMPACTION_THRESHOLD = 0.85  # Compact context at 85% of token limit
+    MICRO_COMPACT_TARGET = 0.70  # Skip LLM summarization if truncation gets us below this
+    TOOL_RESULT_KEEP_CHARS = 200  # Stale tool results truncate to this length
+    HISTORY_MAX_MESSAGES = 200  # In-flight history cap; overflow moves to the archive
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.memory: Optional[MemoryStore] = None
-        self.tool_registry: Optional[ToolRegistry] = None
-        self.tool_executor: Optional[ToolExecutor] = None
+        # Constructed here (cheap, synchronous) so interfaces can be built
+        # and wired while initialize() runs concurrently; the async parts
+        # (db opens, skill discovery) stay in initialize()
+        self.memory = MemoryStore(db_path=settings.memory_db_path)
+        self.tool_registry = ToolRegistry(settings=settings)
+        self.tool_executor = ToolExecutor(
+            tool_registry=self.tool_registry,
+            confirm_before_action=settings.confirm_before_action,
+        )
         self.llm_client = None
-        self.conversation_history: list[Message] = []
+        self.conversation_history: deque[Message] = deque(maxlen=self.HISTORY_MAX_MESSAGES)
+        # Messages displaced from the bounded deque, drained at compaction
+        self._archived: list[Message] = []
+        # Running token count for the history, updated on append — avoids
+        # re-scanning the whole history on every compaction check
+        self._token_count = 0
+        self._encoder = None  # Lazy tiktoken encoder
+        self._system_prompt: Optional[str] = None
+        # Cache-token counters, accumulated across ReAct iterations of a turn
+        self._cache_tokens_read = 0
+        self._cache_tokens_written = 0
+        # Monotonic append counter plus the value it had when the current
+        # turn's user message landed — lets the per-turn context block stay
+        # pinned at one index while tool iterations grow the history
+        self._msg_seq = 0
+        self._turn_seq = 0
+        # Embedding-keyed cache for internal LLM calls (no-op without deps)
+        self._semantic_cache = SemanticCache()
+        # Append-only crash-recovery journal for conversation history
+        self._journal: Optional[aiosqlite.Connection] = None
+        self._journal_buffer: list[tuple[str, str, float]] = []
+        # Fire-and-forget work (memory checks) tracked for clean shutdown
+        self._background_tasks: set[asyncio.Task] = set()
+        self._memorizing: set[str] = set()
+        # Actions from the most recent process_message_stream turn — the
+        # generator only yields text, so interfaces read the summary here
+        self.last_stream_actions: list[str] = []
         self._initialized = False
+        # Set once initialize() completes; message handlers wait on it so
+        # a message arriving during boot blocks briefly instead of failing
+        self.ready = asyncio.Event()
 
     async def initialize(self):
         """Boot sequence — called once at startup."""
         logger.info("Initializing MAX agent...")
 
         # Initialize memory store
-        self.memory = MemoryStore(db_path=self.settings.memory_db_path)
         await self.memory.initialize()
         logger.info(f"Memory initialized at {self.settings.memory_db_path}")
 
-        # Initialize tool registry (auto-discovers skills)
-        self.tool_registry = ToolRegistry(settings=self.settings)
+        # Open the history journal and replay any prior session, so a crash
+        # or restart doesn't cost the context (or an LLM call to rebuild it)
+        await self._open_journal()
+
+        # Discover and register skills
         await self.tool_registry.discover_skills()
         logger.info(f"Loaded {len(self.tool_registry.tools)} tools: {list(self.tool_registry.tools.keys())}")
 
-        # Initialize tool executor
-        self.tool_executor = ToolExecutor(
-            tool_registry=self.tool_registry,
-            confirm_before_action=self.settings.confirm_before_action,
+        # Build the static system prompt once — keeping it byte-identical
+        # across turns lets the provider's prompt cache hit on every call
+        self._system_prompt = build_static_system_prompt(
+            agent_name=self.settings.agent_name,
+            available_tools=self.tool_registry.get_tool_descriptions(),
         )
+        # Pre-built cache-annotated system block — reused verbatim by every
+        # Claude call instead of re-allocating the list/dict per request
+        self._system_blocks = [{
+            "type": "text",
+            "text": self._system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }]
 
         # Initialize LLM client
         self.llm_client = self._build_llm_client()
         logger.info(f"LLM client ready: {self.settings.llm_provider}/{self.settings.llm_model}")
 
         self._initialized = True
+        self.ready.set()
         logger.info("MAX agent fully initialized ✓")
 
     def _build_llm_client(self):
@@ -134,198 +204,560 @@ class MAXAgent:
         returns an AgentResponse.
         """
         if not self._initialized:
-            raise RuntimeError("Agent not initialized. Call initialize() first.")
+            # Boot may still be in flight — main() overlaps initialize()
+            # with interface startup
+            await self.ready.wait()
 
-        logger.debug(f"Processing message from {user_id}: {user_input[:100]}...")
+        logger.debug("Processing message from %s: %.100s...", user_id, user_input)
 
-        # Retrieve relevant memories
-        relevant_memories = await self.memory.search(
+        # Kick off memory retrieval (a disk round-trip) and overlap it with
+        # the pre-turn housekeeping below; await only when the result is needed
+        memory_task = asyncio.create_task(self.memory.search(
             query=user_input,
             user_id=user_id,
             limit=5
-        )
-
-        # Build context-injected system prompt
-        system_prompt = build_system_prompt(
-            agent_name=self.settings.agent_name,
-            memories=relevant_memories,
-            available_tools=self.tool_registry.get_tool_descriptions(),
-            current_time=datetime.utcnow().isoformat(),
-        )
+        ))
 
         # Append user message to history
-        self.conversation_history.append(
+        self._append_message(
             Message(role="user", content=user_input)
         )
+        self._turn_seq = self._msg_seq
 
         # Check if we need to compact context
         if self._should_compact():
             await self._compact_context(user_id)
 
+        relevant_memories = await memory_task
+
+        # Build the per-turn dynamic context (memories + time). This rides
+        # along as a trailing user message so the system prompt stays static.
+        dynamic_context = build_dynamic_context(
+            memories=relevant_memories,
+            current_time=datetime.utcnow().replace(second=0, microsecond=0).isoformat(),
+        )
+
         # Run the ReAct loop
+        self._cache_tokens_read = 0
+        self._cache_tokens_written = 0
         actions_taken = []
         final_response = None
         iterations = 0
 
         while iterations < self.MAX_ITERATIONS:
             iterations += 1
-            logger.debug(f"ReAct iteration {iterations}")
+            logger.debug("ReAct iteration %d", iterations)
 
             # Call the LLM
-            raw_response = await self._call_llm(system_prompt)
-
-            # Check if LLM wants to call a tool
-            tool_calls = self._extract_tool_calls(raw_response)
+            reply = await self._call_llm(dynamic_context)
+            tool_calls = reply.tool_calls
 
             if not tool_calls:
                 # No tool calls — this is the final response
-                final_response = raw_response
+                final_response = reply.text
                 break
 
-            # Execute each tool call
-            for tool_call in tool_calls:
-                tool_name = tool_call.get("name")
-                tool_args = tool_call.get("arguments", {})
+            # Execute the tool calls — concurrently when the model emitted
+            # several in one turn, unless parallel tools are disabled.
+            tool_results = await self._execute_tool_calls(tool_calls, user_id)
+            self._record_tool_iteration(tool_calls, tool_results, actions_taken)
 
-                logger.info(f"Executing tool: {tool_name}({tool_args})")
+        if not final_response:
+            final_response = "I ran into trouble completing that task. Please try again."
+            logger.warning("MAX hit iteration limit without final response")
 
-                tool_result = await self.tool_executor.execute(
-                    tool_name=tool_name,
-                    arguments=tool_args,
-                    user_id=user_id,
-                )
+        self._finish_turn(user_input, final_response, user_id)
 
-                actions_taken.append(f"{tool_name}: {str(tool_args)[:80]}")
+        return AgentResponse(
+            text=final_response,
+            actions_taken=actions_taken,
+            memories_used=[m.content[:60] for m in relevant_memories],
+            cache_tokens_read=self._cache_tokens_read,
+            cache_tokens_written=self._cache_tokens_written,
+        )
 
-                # Inject tool result back into conversation
-                self.conversation_history.append(Message(
-                    role="assistant",
-                    content=json.dumps(tool_call),
-                    metadata={"type": "tool_call"}
-                ))
-                self.conversation_history.append(Message(
-                    role="tool_result",
-                    content=json.dumps(tool_result),
-                    metadata={"tool_name": tool_name}
-                ))
+    async def process_message_stream(self, user_input: str, user_id: str = "default"):
+        """
+        Streaming variant of process_message — an async generator yielding
+        text chunks as the LLM produces them.
+
+        Tool-call iterations are handled internally (their structured output
+        is never yielded); only response text reaches the caller, so the
+        interface can render tokens as they arrive instead of spinning for
+        the full generation.
+        """
+        if not self._initialized:
+            await self.ready.wait()
+
+        memory_task = asyncio.create_task(self.memory.search(
+            query=user_input,
+            user_id=user_id,
+            limit=5
+        ))
+
+        self._append_message(Message(role="user", content=user_input))
+        self._turn_seq = self._msg_seq
+
+        if self._should_compact():
+            await self._compact_context(user_id)
+
+        relevant_memories = await memory_task
+        dynamic_context = build_dynamic_context(
+            memories=relevant_memories,
+            current_time=datetime.utcnow().replace(second=0, microsecond=0).isoformat(),
+        )
+
+        self._cache_tokens_read = 0
+        self._cache_tokens_written = 0
+        actions_taken = []
+        final_response = None
+        iterations = 0
+
+        while iterations < self.MAX_ITERATIONS:
+            iterations += 1
+            logger.debug("ReAct iteration %d (streaming)", iterations)
+
+            reply = None
+            streamed_parts = []
+            async for event in self._call_llm_stream(dynamic_context):
+                if isinstance(event, LLMReply):
+                    reply = event
+                else:
+                    streamed_parts.append(event)
+                    yield event
+
+            if not reply.tool_calls:
+                final_response = reply.text or "".join(streamed_parts)
+                break
+
+            tool_results = await self._execute_tool_calls(reply.tool_calls, user_id)
+            self._record_tool_iteration(reply.tool_calls, tool_results, actions_taken)
 
         if not final_response:
             final_response = "I ran into trouble completing that task. Please try again."
             logger.warning("MAX hit iteration limit without final response")
-
-        # Store assistant response in history
-        self.conversation_history.append(
+            yield final_response
+
+        self.last_stream_actions = actions_taken
+        self._finish_turn(user_input, final_response, user_id)
+
+    def _record_tool_iteration(self, tool_calls: list[dict], tool_results: list[dict], actions_taken: list[str]):
+        """Write one iteration's tool calls and results back into history."""
+        for tool_call, tool_result in zip(tool_calls, tool_results):
+            actions_taken.append(f"{tool_call.get('name')}: {str(tool_call.get('arguments', {}))[:80]}")
+            self._append_message(Message(
+                role="assistant",
+                content=tool_call,
+                metadata={"type": "tool_call"}
+            ))
+            self._append_message(Message(
+                role="tool_result",
+                content=tool_result,
+                metadata={"tool_name": tool_call.get("name")}
+            ))
+
+    def _finish_turn(self, user_input: str, final_response: str, user_id: str):
+        """Post-turn bookkeeping shared by the plain and streaming paths."""
+        self._append_message(
             Message(role="assistant", content=final_response)
         )
 
-        # Proactively store important info in memory
-        await self._maybe_memorize(user_input, final_response, user_id)
+        # Proactively store important info in memory — off the critical path,
+        # so the user gets the response without waiting on the classifier call.
+        if user_id not in self._memorizing:
+            self._memorizing.add(user_id)
+            self._spawn_background(self._maybe_memorize(user_input, final_response, user_id))
 
-        return AgentResponse(
-            text=final_response,
-            actions_taken=actions_taken,
-            memories_used=[m.content[:60] for m in relevant_memories],
-        )
+    async def _execute_tool_calls(self, tool_calls: list[dict], user_id: str) -> list[dict]:
+        """
+        Execute a batch of tool calls, returning results in call order.
+
+        Independent calls run concurrently via asyncio.gather (wall time is
+        max of the latencies instead of the sum). Set PARALLEL_TOOLS=false
+        to force sequential execution for skills with ordering-sensitive
+        side effects.
+        """
+        if logger.isEnabledFor(logging.INFO):
+            for tool_call in tool_calls:
+                # %-style args defer stringifying potentially large payloads
+                logger.info("Executing tool: %s(%.200s)", tool_call.get("name"), tool_call.get("arguments", {}))
+
+        coros = [
+            self.tool_executor.execute(
+                tool_name=tc.get("name"),
+                arguments=tc.get("arguments", {}),
+                user_id=user_id,
+            )
+            for tc in tool_calls
+        ]
 
-    async def _call_llm(self, system_prompt: str) -> str:
+        if len(coros) > 1 and self.settings.parallel_tools:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+        else:
+            results = [await coro for coro in coros]
+
+        # gather(return_exceptions=True) hands back raw exceptions — convert
+        # them to the executor's error-result shape so the loop stays uniform
+        return [
+            r if not isinstance(r, BaseException)
+            else {"success": False, "result": None, "error": str(r),
+                  "tool_name": tc.get("name"), "duration_ms": 0}
+            for tc, r in zip(tool_calls, results)
+        ]
+
+    def _insert_dynamic_context(self, messages: list[dict], dynamic_context: str):
+        """
+        Inject the per-turn context immediately before the turn's first user
+        message. Tool iterations append *after* that index, so the block
+        never moves within a turn and the provider's cached prefix keeps
+        extending instead of being invalidated by a shifting insert point.
+        """
+        appended_this_turn = self._msg_seq - self._turn_seq
+        index = max(len(messages) - 1 - appended_this_turn, 0)
+        messages.insert(index, {"role": "user", "content": dynamic_context})
+
+    @staticmethod
+    def _mark_cache_breakpoint(messages: list[dict]):
+        """Breakpoint on the newest message so iterations 2..N of this turn
+        read the entire prior conversation from cache."""
+        if messages:
+            last = messages[-1]
+            if isinstance(last["content"], str):
+                last["content"] = [{
+                    "type": "text",
+                    "text": last["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }]
+
+    async def _call_llm(self, dynamic_context: Optional[str] = None) -> LLMReply:
         """Call the configured LLM with current conversation history."""
         messages = self._history_to_messages()
+        if dynamic_context:
+            self._insert_dynamic_context(messages, dynamic_context)
+
         provider = self.settings.llm_provider.lower()
 
         if provider == "claude":
+            self._mark_cache_breakpoint(messages)
+
             response = await self.llm_client.messages.create(
                 model=self.settings.llm_model,
                 max_tokens=4096,
-                system=system_prompt,
+                system=self._system_blocks,
                 tools=self.tool_registry.get_claude_tool_schemas(),
                 messages=messages,
             )
+            self._track_cache_usage(response.usage)
             # Handle tool use blocks
             if response.stop_reason == "tool_use":
-                return json.dumps({
-                    "tool_calls": [
-                        {"name": block.name, "arguments": block.input}
-                        for block in response.content
-                        if block.type == "tool_use"
-                    ]
-                })
-            return response.content[0].text
+                return LLMReply(tool_calls=[
+                    {"name": block.name, "arguments": block.input}
+                    for block in response.content
+                    if block.type == "tool_use"
+                ])
+            return LLMReply(text=response.content[0].text)
 
         else:
             # OpenAI-compatible (openai, deepseek, ollama)
             response = await self.llm_client.chat.completions.create(
                 model=self.settings.llm_model,
-                messages=[{"role": "system", "content": system_prompt}] + messages,
+                messages=[{"role": "system", "content": self._system_prompt}] + messages,
                 tools=self.tool_registry.get_openai_tool_schemas(),
                 max_tokens=4096,
             )
+            self._track_cache_usage(response.usage)
             choice = response.choices[0]
             if choice.finish_reason == "tool_calls":
-                return json.dumps({
-                    "tool_calls": [
-                        {"name": tc.function.name, "arguments": json.loads(tc.function.arguments)}
-                        for tc in choice.message.tool_calls
-                    ]
-                })
-            return choice.message.content
-
-    def _extract_tool_calls(self, raw_response: str) -> list[dict]:
-        """Parse tool calls from LLM response."""
-        try:
-            parsed = json.loads(raw_response)
-            return parsed.get("tool_calls", [])
-        except (json.JSONDecodeError, AttributeError):
-            return []
+                return LLMReply(tool_calls=[
+                    {"name": tc.function.name, "arguments": json_io.loads(tc.function.arguments)}
+                    for tc in choice.message.tool_calls
+                ])
+            return LLMReply(text=choice.message.content)
+
+    async def _call_llm_stream(self, dynamic_context: Optional[str] = None):
+        """
+        Streaming counterpart of _call_llm.
+
+        Async generator: yields text chunks (str) as they arrive, then a
+        final LLMReply carrying the complete text and any tool calls.
+        """
+        messages = self._history_to_messages()
+        if dynamic_context:
+            self._insert_dynamic_context(messages, dynamic_context)
+
+        provider = self.settings.llm_provider.lower()
+
+        if provider == "claude":
+            self._mark_cache_breakpoint(messages)
+
+            async with self.llm_client.messages.stream(
+                model=self.settings.llm_model,
+                max_tokens=4096,
+                system=self._system_blocks,
+                tools=self.tool_registry.get_claude_tool_schemas(),
+                messages=messages,
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                final = await stream.get_final_message()
+
+            self._track_cache_usage(final.usage)
+            if final.stop_reason == "tool_use":
+                yield LLMReply(tool_calls=[
+                    {"name": block.name, "arguments": block.input}
+                    for block in final.content
+                    if block.type == "tool_use"
+                ])
+            else:
+                yield LLMReply(text="".join(
+                    block.text for block in final.content if block.type == "text"
+                ))
+
+        else:
+            # OpenAI-compatible (openai, deepseek, ollama)
+            stream = await self.llm_client.chat.completions.create(
+                model=self.settings.llm_model,
+                messages=[{"role": "system", "content": self._system_prompt}] + messages,
+                tools=self.tool_registry.get_openai_tool_schemas(),
+                max_tokens=4096,
+                stream=True,
+            )
+
+            text_parts = []
+            tool_calls_acc: dict[int, dict] = {}
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    text_parts.append(delta.content)
+                    yield delta.content
+                # Tool-call arguments stream as fragments keyed by index
+                for tc in delta.tool_calls or []:
+                    acc = tool_calls_acc.setdefault(tc.index, {"name": "", "arguments": ""})
+                    if tc.function.name:
+                        acc["name"] = tc.function.name
+                    if tc.function.arguments:
+                        acc["arguments"] += tc.function.arguments
+
+            if tool_calls_acc:
+                yield LLMReply(tool_calls=[
+                    {"name": acc["name"], "arguments": json_io.loads(acc["arguments"] or "{}")}
+                    for _, acc in sorted(tool_calls_acc.items())
+                ])
+            else:
+                yield LLMReply(text="".join(text_parts))
+
+    def _track_cache_usage(self, usage) -> None:
+        """Accumulate prompt-cache token counts from a provider usage block."""
+        if usage is None:
+            return
+
+        # Anthropic: cache_read_input_tokens / cache_creation_input_tokens
+        read = getattr(usage, "cache_read_input_tokens", None)
+        written = getattr(usage, "cache_creation_input_tokens", None)
+
+        # OpenAI-compatible: usage.prompt_tokens_details.cached_tokens
+        if read is None:
+            details = getattr(usage, "prompt_tokens_details", None)
+            read = getattr(details, "cached_tokens", None)
+
+        self._cache_tokens_read += read or 0
+        self._cache_tokens_written += written or 0
+
+        if read or written:
+            logger.debug("Prompt cache: read=%d written=%d tokens", read or 0, written or 0)
+
+    @staticmethod
+    def _render_content(msg: Message) -> str:
+        """
+        Serialize a message's payload to text exactly once.
+
+        Dict payloads (tool calls/results) render to compact JSON — no
+        pretty-printing whitespace, fewer billed tokens — and the rendered
+        string is cached so repeated ReAct iterations reuse it.
+        """
+        if isinstance(msg.content, str):
+            return msg.content
+        rendered = msg.metadata.get("_rendered")
+        if rendered is None:
+            rendered = msg.metadata["_rendered"] = json_io.dumps(msg.content)
+        return rendered
 
     def _history_to_messages(self) -> list[dict]:
         """Convert internal Message objects to LLM API format."""
         messages = []
-        for msg in self.conversation_history[-40:]:  # Last 40 messages
+        start = max(0, len(self.conversation_history) - 40)  # Last 40 messages
+        for msg in itertools.islice(self.conversation_history, start, None):
             if msg.role == "tool_result":
-                messages.append({"role": "user", "content": f"[Tool Result]: {msg.content}"})
+                messages.append({"role": "user", "content": f"[Tool Result]: {self._render_content(msg)}"})
             else:
-                messages.append({"role": msg.role, "content": msg.content})
+                messages.append({"role": msg.role, "content": self._render_content(msg)})
         return messages
 
+    def _count_tokens(self, text: str) -> int:
+        """Token count for a message, via tiktoken when available."""
+        if self._encoder is None:
+            self._encoder = get_tokenizer()
+        if self._encoder is not None:
+            return len(self._encoder.encode(text)) + 4  # +4 role/format overhead
+        # Fallback heuristic: 4 chars ≈ 1 token
+        return len(text) // 4 + 4
+
+    async def _open_journal(self):
+        """Open the append-only history journal and replay it into the deque."""
+        self._journal = await aiosqlite.connect(self.settings.history_journal_path)
+        await self._journal.execute("PRAGMA journal_mode=WAL")
+        await self._journal.execute(
+            """
+            CREATE TABLE IF NOT EXISTS history (
+                id      INTEGER PRIMARY KEY AUTOINCREMENT,
+                role    TEXT NOT NULL,
+                content TEXT NOT NULL,
+                ts      REAL NOT NULL
+            )
+            """
+        )
+        await self._journal.commit()
+
+        rows = await self._journal.execute_fetchall(
+            "SELECT role, content, ts FROM history ORDER BY id DESC LIMIT ?",
+            (self.HISTORY_MAX_MESSAGES,)
+        )
+        if rows:
+            for role, content, ts in reversed(rows):
+                self.conversation_history.append(
+                    Message(role=role, content=content, timestamp=ts)
+                )
+            self._rebuild_token_count()
+            logger.info(f"Restored {len(rows)} messages from history journal")
+
+    def _journal_append(self, msg: Message):
+        """Buffer a message for the journal, flushing in batches."""
+        if self._journal is None:
+            return
+        self._journal_buffer.append((msg.role, self._render_content(msg), msg.timestamp))
+        if len(self._journal_buffer) >= self.JOURNAL_FLUSH_EVERY:
+            self._spawn_background(self._flush_journal())
+
+    async def _flush_journal(self):
+        """Write buffered messages to the journal in one transaction."""
+        if self._journal is None or not self._journal_buffer:
+            return
+        batch, self._journal_buffer = self._journal_buffer, []
+        try:
+            await self._journal.executemany(
+                "INSERT INTO history (role, content, ts) VALUES (?, ?, ?)", batch
+            )
+            await self._journal.commit()
+        except Exception as e:
+            logger.warning(f"History journal flush failed: {e}")
+
+    def _spawn_background(self, coro) -> asyncio.Task:
+        """Track a fire-and-forget coroutine for clean shutdown."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _append_message(self, msg: Message):
+        """Append to history, keeping the running token count current."""
+        self._msg_seq += 1
+        self._journal_append(msg)
+        if len(self.conversation_history) == self.HISTORY_MAX_MESSAGES:
+            # Deque is full — archive the oldest message instead of losing it
+            displaced = self.conversation_history.popleft()
+            self._archived.append(displaced)
+            self._token_count -= self._count_tokens(self._render_content(displaced))
+        self.conversation_history.append(msg)
+        self._token_count += self._count_tokens(self._render_content(msg))
+
+    def _rebuild_token_count(self):
+        """Recount from scratch — only needed after bulk history rewrites."""
+        self._token_count = sum(
+            self._count_tokens(self._render_content(m)) for m in self.conversation_history
+        )
+
+    def clear_history(self):
+        """Drop all conversation history (used by the /clear commands)."""
+        self.conversation_history.clear()
+        self._archived.clear()
+        self._token_count = 0
+        self._journal_buffer.clear()
+        if self._journal is not None:
+            self._spawn_background(self._clear_journal())
+
+    async def _clear_journal(self):
+        await self._journal.execute("DELETE FROM history")
+        await self._journal.commit()
+
     def _should_compact(self) -> bool:
-        """
-        Estimate if we're approaching the context window limit.
-        Rough heuristic: 4 chars ≈ 1 token.
-        """
-        total_chars = sum(len(m.content) for m in self.conversation_history)
-        estimated_tokens = total_chars / 4
-        limit = self.settings.max_context_tokens
-        ratio = estimated_tokens / limit
+        """Check the running token count against the context window limit."""
+        ratio = self._token_count / self.settings.max_context_tokens
         if ratio > self.COMPACTION_THRESHOLD:
             logger.warning(f"Context at {ratio:.0%} capacity — triggering compaction")
             return True
         return False
 
+    def _micro_compact(self) -> bool:
+        """
+        Cheap first-pass compaction: truncate stale tool results in place.
+
+        Most history bulk is verbose tool-result JSON that stops mattering
+        after a few turns. Truncating it reclaims tokens without paying for
+        a summarization LLM call. Returns True if anything was truncated.
+        """
+        changed = False
+        keep_from = max(0, len(self.conversation_history) - 10)
+        for msg in itertools.islice(self.conversation_history, 0, keep_from):
+            if msg.role == "tool_result" and not msg.metadata.get("truncated"):
+                rendered = self._render_content(msg)
+                if len(rendered) > self.TOOL_RESULT_KEEP_CHARS:
+                    msg.content = rendered[:self.TOOL_RESULT_KEEP_CHARS] + "…[truncated]"
+                    msg.metadata.pop("_rendered", None)
+                    msg.metadata["truncated"] = True
+                    changed = True
+        return changed
+
     async def _compact_context(self, user_id: str):
         """
-        Summarize old conversation history to free context space.
-        Preserves the most recent 10 messages verbatim.
+        Reclaim context space, cheapest strategy first.
+
+        Pass 1 truncates old tool results (no LLM call). Only if the history
+        is still over MICRO_COMPACT_TARGET do we escalate to LLM
+        summarization, preserving the most recent 10 messages verbatim.
         """
         logger.info("Compacting conversation context...")
-        if len(self.conversation_history) <= 10:
+        if len(self.conversation_history) <= 10 and not self._archived:
             return
 
-        old_messages = self.conversation_history[:-10]
-        recent_messages = self.conversation_history[-10:]
+        if self._micro_compact():
+            self._rebuild_token_count()
+            ratio = self._token_count / self.settings.max_context_tokens
+            if ratio < self.MICRO_COMPACT_TARGET:
+                logger.info(f"Micro-compaction sufficient — context now at {ratio:.0%}")
+                return
+
+        history = list(self.conversation_history)
+        old_messages = self._archived + history[:-10]
+        recent_messages = history[-10:]
 
         # Ask LLM to summarize old messages
         summary_prompt = (
             "Summarize the following conversation history concisely, "
             "preserving all key facts, decisions, and outcomes:\n\n"
-            + "\n".join(f"{m.role}: {m.content}" for m in old_messages)
+            + "\n".join(f"{m.role}: {self._render_content(m)}" for m in old_messages)
         )
 
         summary = await self._call_llm_simple(summary_prompt)
 
-        # Replace old history with summary
-        self.conversation_history = [
-            Message(role="assistant", content=f"[Context summary]: {summary}"),
-        ] + recent_messages
+        # Replace old history (including the archive) with the summary
+        self.conversation_history = deque(
+            [Message(role="assistant", content=f"[Context summary]: {summary}")] + recent_messages,
+            maxlen=self.HISTORY_MAX_MESSAGES,
+        )
+        self._archived.clear()
+        self._rebuild_token_count()
 
         # Store the summary in long-term memory
         await self.memory.store(
@@ -335,8 +767,18 @@ class MAXAgent:
         )
         logger.info("Context compacted and stored in memory")
 
-    async def _call_llm_simple(self, prompt: str) -> str:
-        """Simple single-turn LLM call without tool use, for internal tasks."""
+    async def _call_llm_simple(self, prompt: str, cache_namespace: Optional[str] = None) -> str:
+        """
+        Simple single-turn LLM call without tool use, for internal tasks.
+
+        When cache_namespace is given, near-duplicate prompts are served
+        from the semantic cache instead of hitting the LLM again.
+        """
+        if cache_namespace:
+            cached = self._semantic_cache.get(cache_namespace, prompt)
+            if cached is not None:
+                return cached
+
         provider = self.settings.llm_provider.lower()
         if provider == "claude":
             response = await self.llm_client.messages.create(
@@ -344,14 +786,18 @@ class MAXAgent:
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}]
             )
-            return response.content[0].text
+            result = response.content[0].text
         else:
             response = await self.llm_client.chat.completions.create(
                 model=self.settings.llm_model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=1024,
             )
-            return response.choices[0].message.content
+            result = response.choices[0].message.content
+
+        if cache_namespace:
+            self._semantic_cache.put(cache_namespace, prompt, result)
+        return result
 
     async def _maybe_memorize(self, user_input: str, response: str, user_id: str):
         """Ask the LLM if anything in this exchange is worth storing long-term."""
@@ -366,20 +812,36 @@ important decisions, contact info, etc.), respond with a JSON object:
 If nothing is worth storing, respond with: {{"should_store": false}}"""
 
         try:
-            result_str = await self._call_llm_simple(check_prompt)
-            result = json.loads(result_str)
+            result_str = await self._call_llm_simple(check_prompt, cache_namespace="memorize")
+            result = json_io.loads(result_str)
             if result.get("should_store"):
                 await self.memory.store(
                     content=result["content"],
                     user_id=user_id,
                     tags=result.get("tags", []),
                 )
-                logger.debug(f"Stored memory: {result['content'][:80]}")
+                logger.debug("Stored memory: %.80s", result["content"])
         except Exception as e:
             logger.debug(f"Memory check failed (non-critical): {e}")
+        finally:
+            self._memorizing.discard(user_id)
 
     async def shutdown(self):
         """Clean shutdown."""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self._flush_journal()
+        if self._journal:
+            await self._journal.close()
+        # Let skills release pooled connections and other resources
+        if self.tool_registry:
+            for skill in self.tool_registry.skills.values():
+                closer = getattr(skill, "close", None)
+                if closer:
+                    try:
+                        await closer()
+                    except Exception as e:
+                        logger.warning(f"Skill '{skill.name}' close failed: {e}")
         if self.memory:
             await self.memory.close()
         logger.info("Agent shutdown complete")
@@ -0,0 +1,57 @@
+"""
+agent_models.py — Process-wide model and tokenizer singletons.
+
+MAXAgent can be instantiated more than once per process (tests, one agent
+per user). Tokenizers are cheap-ish but the sentence-transformers embedding
+model is hundreds of MB — these lru_cache factories make sure each is
+loaded exactly once and shared by every agent in the process.
+"""
+
+import functools
+import logging
+from typing import Optional
+
+logger = logging.getLogger("MAX.agent_models")
+
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+
+
+@functools.lru_cache(maxsize=1)
+def get_tokenizer():
+    """Shared tiktoken encoder, or None when tiktoken isn't installed."""
+    if not HAS_TIKTOKEN:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=1)
+def get_embedding_model(model_name: str = "all-MiniLM-L6-v2"):
+    """
+    Shared sentence-transformers model, or None when the dependency is
+    missing. Picks GPU/MPS when available, CPU otherwise.
+    """
+    if not HAS_SENTENCE_TRANSFORMERS:
+        return None
+
+    device = "cpu"
+    try:
+        import torch
+        if torch.cuda.is_available():
+            device = "cuda"
+        elif getattr(torch.backends, "mps", None) and torch.backends.mps.is_available():
+            device = "mps"
+    except ImportError:
+        pass
+
+    logger.info(f"Loading embedding model '{model_name}' on {device}")
+    return SentenceTransformer(model_name, device=device)
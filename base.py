@@ -3,15 +3,62 @@ skills/base.py — BaseSkill class and @skill_action decorator.
 
 All MAX skills inherit from BaseSkill.
 The @skill_action decorator registers methods as callable tools.
+
+Tool schemas (Claude, OpenAI, and prompt descriptions) are derived from
+action signatures exactly once per subclass, at class-definition time via
+__init_subclass__, and frozen as tuples — the request path never touches
+inspect or get_type_hints.
 """
 
 import functools
 import inspect
 import logging
+import typing
 from typing import Any, Callable, get_type_hints
 
 logger = logging.getLogger("MAX.skills")
 
+_TYPE_MAP = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    tuple: "array",
+    set: "array",
+    dict: "object",
+}
+
+
+def _json_schema_type(python_type) -> dict:
+    """
+    Map a Python annotation to a JSON-schema fragment.
+
+    Handles parameterized generics, which the old scalar map silently
+    collapsed to "string": list[str] becomes a typed array, and
+    Optional[T] is unwrapped to T. Wrong schemas aren't just cosmetic —
+    the LLM retries mistyped tool calls, and every retry is a paid
+    round-trip.
+    """
+    origin = typing.get_origin(python_type)
+
+    if origin is typing.Union:
+        # Optional[T] is Union[T, None] — strip the NoneType arm
+        args = [a for a in typing.get_args(python_type) if a is not type(None)]
+        if len(args) == 1:
+            return _json_schema_type(args[0])
+        return {"type": "string"}
+
+    if origin in (list, tuple, set):
+        args = typing.get_args(python_type)
+        items = _json_schema_type(args[0]) if args else {"type": "string"}
+        return {"type": "array", "items": items}
+
+    if origin is dict:
+        return {"type": "object"}
+
+    return {"type": _TYPE_MAP.get(python_type, "string")}
+
 
 def skill_action(description: str, confirm_required: bool = False):
     """
@@ -38,6 +85,63 @@ def skill_action(description: str, confirm_required: bool = False):
     return decorator
 
 
+def _schemas_for_action(tool_name: str, action: Callable) -> tuple[dict, dict, dict]:
+    """Derive (description, claude_schema, openai_schema) for one action."""
+    sig = inspect.signature(action)
+    hints = get_type_hints(action)
+
+    params = {}
+    properties = {}
+    required = []
+
+    for param_name, param in sig.parameters.items():
+        if param_name == "self":
+            continue
+        param_type = hints.get(param_name, str)
+        type_fragment = _json_schema_type(param_type)
+        is_required = param.default is inspect.Parameter.empty
+
+        params[param_name] = {
+            **type_fragment,
+            "required": is_required,
+        }
+        properties[param_name] = {
+            **type_fragment,
+            "description": f"The {param_name} parameter",
+        }
+        if is_required:
+            required.append(param_name)
+
+    description = {
+        "name": tool_name,
+        "description": action._action_description,
+        "parameters": params,
+        "confirm_required": action._confirm_required,
+    }
+    claude_schema = {
+        "name": tool_name,
+        "description": action._action_description,
+        "input_schema": {
+            "type": "object",
+            "properties": properties,
+            "required": required,
+        }
+    }
+    openai_schema = {
+        "type": "function",
+        "function": {
+            "name": tool_name,
+            "description": action._action_description,
+            "parameters": {
+                "type": "object",
+                "properties": properties,
+                "required": required,
+            }
+        }
+    }
+    return description, claude_schema, openai_schema
+
+
 class BaseSkill:
     """
     Abstract base class for all MAX skills.
@@ -59,6 +163,33 @@ class BaseSkill:
     description: str = "Base skill"
     enabled: bool = True
 
+    # Populated per subclass by __init_subclass__; frozen so nothing
+    # downstream can mutate shared schema state between requests
+    _tool_descriptions: tuple[dict, ...] = ()
+    _claude_schemas: tuple[dict, ...] = ()
+    _openai_schemas: tuple[dict, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        descriptions = []
+        claude_schemas = []
+        openai_schemas = []
+
+        for attr_name in dir(cls):
+            if attr_name.startswith("_"):
+                continue
+            attr = getattr(cls, attr_name)
+            if callable(attr) and getattr(attr, "_is_skill_action", False):
+                desc, claude, openai = _schemas_for_action(f"{cls.name}__{attr_name}", attr)
+                descriptions.append(desc)
+                claude_schemas.append(claude)
+                openai_schemas.append(openai)
+
+        cls._tool_descriptions = tuple(descriptions)
+        cls._claude_schemas = tuple(claude_schemas)
+        cls._openai_schemas = tuple(openai_schemas)
+
     def __init__(self, settings=None):
         self.settings = settings
         self._actions = self._discover_actions()
@@ -74,95 +205,17 @@ class BaseSkill:
                 actions[f"{self.name}__{attr_name}"] = attr
         return actions
 
-    def get_tool_descriptions(self) -> list[dict]:
+    def get_tool_descriptions(self) -> tuple[dict, ...]:
         """Return tool metadata for inclusion in LLM prompts."""
-        tools = []
-        for tool_name, action in self._actions.items():
-            sig = inspect.signature(action)
-            params = {}
-            hints = get_type_hints(action)
-
-            for param_name, param in sig.parameters.items():
-                if param_name == "self":
-                    continue
-                param_type = hints.get(param_name, str)
-                params[param_name] = {
-                    "type": self._python_type_to_json(param_type),
-                    "required": param.default is inspect.Parameter.empty,
-                }
-
-            tools.append({
-                "name": tool_name,
-                "description": action._action_description,
-                "parameters": params,
-                "confirm_required": action._confirm_required,
-            })
-        return tools
-
-    def get_claude_schemas(self) -> list[dict]:
+        return self._tool_descriptions
+
+    def get_claude_schemas(self) -> tuple[dict, ...]:
         """Return Claude-format tool schemas."""
-        schemas = []
-        for tool_name, action in self._actions.items():
-            sig = inspect.signature(action)
-            hints = get_type_hints(action)
-            properties = {}
-            required = []
-
-            for param_name, param in sig.parameters.items():
-                if param_name == "self":
-                    continue
-                param_type = hints.get(param_name, str)
-                properties[param_name] = {
-                    "type": self._python_type_to_json(param_type),
-                    "description": f"The {param_name} parameter",
-                }
-                if param.default is inspect.Parameter.empty:
-                    required.append(param_name)
-
-            schemas.append({
-                "name": tool_name,
-                "description": action._action_description,
-                "input_schema": {
-                    "type": "object",
-                    "properties": properties,
-                    "required": required,
-                }
-            })
-        return schemas
-
-    def get_openai_schemas(self) -> list[dict]:
+        return self._claude_schemas
+
+    def get_openai_schemas(self) -> tuple[dict, ...]:
         """Return OpenAI-format function tool schemas."""
-        schemas = []
-        for tool_name, action in self._actions.items():
-            sig = inspect.signature(action)
-            hints = get_type_hints(action)
-            properties = {}
-            required = []
-
-            for param_name, param in sig.parameters.items():
-                if param_name == "self":
-                    continue
-                param_type = hints.get(param_name, str)
-                properties[param_name] = {
-                    "type": self._python_type_to_json(param_type),
-                    "description": f"The {param_name} parameter",
-                }
-                if param.default is inspect.Parameter.empty:
-                    required.append(param_name)
-
-            schemas.append({
-                "type": "function",
-                "function": {
-                    "name": tool_name,
-                    "description": action._action_description,
-                    "parameters": {
-                        "type": "object",
-                        "properties": properties,
-                        "required": required,
-                    }
-                }
-            })
-        return schemas
+        return self._openai_schemas
 
     async def execute(self, action_name: str, arguments: dict) -> Any:
         """Execute a named action with given arguments."""
@@ -176,12 +229,5 @@ class BaseSkill:
 
     @staticmethod
     def _python_type_to_json(python_type) -> str:
-        type_map = {
-            str: "string",
-            int: "integer",
-            float: "number",
-            bool: "boolean",
-            list: "array",
-            dict: "object",
-        }
-        return type_map.get(python_type, "string")
+        """Scalar JSON type name for an annotation (kept for compatibility)."""
+        return _json_schema_type(python_type)["type"]
@@ -10,6 +10,7 @@ Rich interactive REPL with:
 """
 
 import asyncio
+import concurrent.futures
 import logging
 import sys
 
@@ -52,6 +53,27 @@ class CLIInterface:
         self.console = Console() if HAS_RICH else None
         self.running = True
 
+        # O(1) command dispatch — new commands only need a handler entry here
+        self._handlers = {
+            "/quit": self._cmd_quit,
+            "/exit": self._cmd_quit,
+            "/help": self._cmd_help,
+            "/memory": self._cmd_memory,
+            "/clear": self._cmd_clear,
+            "/history": self._cmd_history,
+            "/skills": self._cmd_skills,
+        }
+        self._help_text = "\n".join(
+            ["", "Available commands:"]
+            + [f"  {k:12s} — {v}" for k, v in self.COMMANDS.items()]
+        )
+
+        # Dedicated single thread for blocking input() — keeps the prompt
+        # responsive even when tools saturate the default executor
+        self._input_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cli-input"
+        )
+
         # Wire confirmation callback to CLI prompt
         self.agent.tool_executor.set_confirm_callback(self._cli_confirm)
 
@@ -59,29 +81,52 @@ class CLIInterface:
         """Start the interactive CLI loop."""
         self._print_welcome()
 
-        while self.running:
-            try:
-                user_input = await self._get_input()
-            except (EOFError, KeyboardInterrupt):
-                self._print("\n👋 Goodbye!")
-                break
+        try:
+            while self.running:
+                try:
+                    user_input = await self._get_input()
+                except (EOFError, KeyboardInterrupt):
+                    self._print("\n👋 Goodbye!")
+                    break
 
-            if not user_input.strip():
-                continue
+                if not user_input.strip():
+                    continue
 
-            if user_input.startswith("/"):
-                await self._handle_command(user_input.strip())
-                continue
+                if user_input.startswith("/"):
+                    await self._handle_command(user_input.strip())
+                    continue
 
-            await self._process_and_display(user_input)
+                await self._process_and_display(user_input)
+        finally:
+            self._input_executor.shutdown(wait=False, cancel_futures=True)
 
     async def _process_and_display(self, user_input: str):
-        """Send message to agent and display the response."""
+        """Send message to agent and display the response as it streams in."""
         if HAS_RICH:
-            with Live(Spinner("dots", text=" MAX is thinking..."), console=self.console, refresh_per_second=10):
-                response = await self.agent.process_message(
+            # Stream tokens into a live-updating panel: the spinner only
+            # shows until the first chunk arrives, then text renders as it
+            # is generated instead of after the full response.
+            accumulated = ""
+            with Live(
+                Spinner("dots", text=" MAX is thinking..."),
+                console=self.console,
+                refresh_per_second=10,
+            ) as live:
+                async for chunk in self.agent.process_message_stream(
                     user_input=user_input,
                     user_id="cli_user",
+                ):
+                    accumulated += chunk
+                    live.update(
+                        Panel(
+                            Markdown(accumulated),
+                            title=f"[bold green]{self.settings.agent_name}[/bold green]",
+                            border_style="green",
+                        )
+                    )
+            if self.agent.last_stream_actions:
+                self.console.print(
+                    f"[dim]🔧 Actions: {', '.join(self.agent.last_stream_actions)}[/dim]"
                 )
         else:
             print("⏳ MAX is thinking...")
@@ -89,22 +134,6 @@ class CLIInterface:
                 user_input=user_input,
                 user_id="cli_user",
             )
-
-        # Display response
-        if HAS_RICH:
-            self.console.print()
-            self.console.print(
-                Panel(
-                    Markdown(response.text),
-                    title=f"[bold green]{self.settings.agent_name}[/bold green]",
-                    border_style="green",
-                )
-            )
-            if response.actions_taken:
-                self.console.print(
-                    f"[dim]🔧 Actions: {', '.join(response.actions_taken)}[/dim]"
-                )
-        else:
             print(f"\n{self.settings.agent_name}: {response.text}\n")
             if response.actions_taken:
                 print(f"  [Actions: {', '.join(response.actions_taken)}]\n")
@@ -115,52 +144,52 @@ class CLIInterface:
         if HAS_RICH:
             self.console.print(f"\n[bold cyan]You:[/bold cyan] ", end="")
 
-        return await loop.run_in_executor(None, input, "" if HAS_RICH else "You: ")
+        return await loop.run_in_executor(self._input_executor, input, "" if HAS_RICH else "You: ")
 
     async def _handle_command(self, command: str):
-        """Handle slash commands."""
-        cmd = command.lower().split()[0]
-
-        if cmd in ("/quit", "/exit"):
-            self.running = False
-            self._print("👋 Shutting down MAX...")
-
-        elif cmd == "/help":
-            lines = [f"  {k:12s} — {v}" for k, v in self.COMMANDS.items()]
-            self._print("\n".join(["", "Available commands:"] + lines, ))
-
-        elif cmd == "/memory":
-            memories = await self.agent.memory.get_all(user_id="cli_user")
-            if not memories:
-                self._print("No memories stored yet.")
-            else:
-                self._print(f"\n🧠 {len(memories)} stored memories:")
-                for m in memories[:20]:
-                    tags = f" [{', '.join(m.tags)}]" if m.tags else ""
-                    self._print(f"  • {m.content[:100]}{tags}")
-
-        elif cmd == "/clear":
-            self.agent.conversation_history.clear()
-            self._print("✅ Conversation history cleared.")
-
-        elif cmd == "/history":
-            log = self.agent.tool_executor.get_audit_log(limit=15)
-            if not log:
-                self._print("No tool actions recorded yet.")
-            else:
-                self._print(f"\n🔧 Last {len(log)} tool actions:")
-                for e in log:
-                    status = "✅" if e["success"] else "❌"
-                    self._print(f"  {status} {e['tool']:30s} {e['timestamp'][:16]}")
-
-        elif cmd == "/skills":
-            self._print(f"\n🛠️  Loaded skills:")
-            for name, skill in self.agent.tool_registry.skills.items():
-                tools = list(skill._actions.keys())
-                self._print(f"  📦 {name}: {', '.join(t.split('__')[1] for t in tools)}")
+        """Handle slash commands via the dispatch table."""
+        cmd = command.split()[0].lower()
+        await self._handlers.get(cmd, self._cmd_unknown)(command)
 
+    async def _cmd_quit(self, command: str):
+        self.running = False
+        self._print("👋 Shutting down MAX...")
+
+    async def _cmd_help(self, command: str):
+        self._print(self._help_text)
+
+    async def _cmd_memory(self, command: str):
+        memories = await self.agent.memory.get_all(user_id="cli_user")
+        if not memories:
+            self._print("No memories stored yet.")
+        else:
+            self._print(f"\n🧠 {len(memories)} stored memories:")
+            for m in memories[:20]:
+                tags = f" [{', '.join(m.tags)}]" if m.tags else ""
+                self._print(f"  • {m.content[:100]}{tags}")
+
+    async def _cmd_clear(self, command: str):
+        self.agent.clear_history()
+        self._print("✅ Conversation history cleared.")
+
+    async def _cmd_history(self, command: str):
+        log = self.agent.tool_executor.get_audit_log(limit=15)
+        if not log:
+            self._print("No tool actions recorded yet.")
         else:
-            self._print(f"Unknown command: {command}. Type /help for available commands.")
+            self._print(f"\n🔧 Last {len(log)} tool actions:")
+            for e in log:
+                status = "✅" if e["success"] else "❌"
+                self._print(f"  {status} {e['tool']:30s} {e['timestamp'][:16]}")
+
+    async def _cmd_skills(self, command: str):
+        self._print(f"\n🛠️  Loaded skills:")
+        for name, skill in self.agent.tool_registry.skills.items():
+            tools = list(skill._actions.keys())
+            self._print(f"  📦 {name}: {', '.join(t.split('__')[1] for t in tools)}")
+
+    async def _cmd_unknown(self, command: str):
+        self._print(f"Unknown command: {command}. Type /help for available commands.")
 
     async def _cli_confirm(self, prompt: str) -> bool:
         """Interactive confirmation prompt for destructive actions."""
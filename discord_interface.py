@@ -11,6 +11,7 @@ Supports:
 
 import asyncio
 import logging
+from collections import OrderedDict
 
 import discord
 from discord.ext import commands
@@ -22,6 +23,12 @@ from config.settings import Settings
 logger = logging.getLogger("MAX.interface.discord")
 
 MAX_DISCORD_LEN = 2000
+# Embed limits: 4096-char description, 1024-char field values, 6000 total
+MAX_EMBED_DESC = 4096
+MAX_EMBED_FIELD = 1024
+MAX_EMBED_TOTAL = 6000
+CONFIRM_TIMEOUT = 300        # Seconds before an unanswered confirmation denies
+MAX_PENDING_CONFIRMS = 128   # Unanswered confirmations kept before evicting
 
 
 class DiscordInterface:
@@ -30,7 +37,12 @@ class DiscordInterface:
     def __init__(self, agent: MAXAgent, settings: Settings):
         self.agent = agent
         self.settings = settings
-        self._pending_confirms: dict[int, asyncio.Future] = {}
+        # Insertion-ordered so the oldest unanswered confirmation is
+        # evicted first when the bound is hit — a plain dict grew without
+        # limit if prompts were never reacted to
+        self._pending_confirms: "OrderedDict[int, asyncio.Future]" = OrderedDict()
+        self._last_channel = None  # Most recent channel, for confirmations
+        self._skills_text: str = ""  # Built on first !skills, fixed thereafter
 
         # Set up Discord client
         intents = discord.Intents.default()
@@ -77,11 +89,12 @@ class DiscordInterface:
             if user == self.bot.user:
                 return
             msg_id = reaction.message.id
-            if msg_id in self._pending_confirms:
+            fut = self._pending_confirms.get(msg_id)
+            if fut is not None and not fut.done():
                 if str(reaction.emoji) == "✅":
-                    self._pending_confirms[msg_id].set_result(True)
+                    fut.set_result(True)
                 elif str(reaction.emoji) == "❌":
-                    self._pending_confirms[msg_id].set_result(False)
+                    fut.set_result(False)
 
     def _register_commands(self):
         @self.bot.command(name="memory")
@@ -99,20 +112,25 @@ class DiscordInterface:
         @self.bot.command(name="clear")
         async def cmd_clear(ctx: commands.Context):
             """Clear conversation history"""
-            self.agent.conversation_history.clear()
+            self.agent.clear_history()
             await ctx.send("✅ Conversation history cleared.")
 
         @self.bot.command(name="skills")
         async def cmd_skills(ctx: commands.Context):
             """List available skills"""
-            lines = ["**🛠️ Available Skills:**"]
-            for name, skill in self.agent.tool_registry.skills.items():
-                actions = [t.split("__")[1] for t in skill._actions]
-                lines.append(f"**{name}**: {', '.join(actions)}")
-            await ctx.send("\n".join(lines))
+            # The registry is fixed after startup, so the listing is
+            # rendered once and reused on every subsequent !skills
+            if not self._skills_text:
+                lines = ["**🛠️ Available Skills:**"]
+                for name, skill in self.agent.tool_registry.skills.items():
+                    actions = [t.split("__")[1] for t in skill._actions]
+                    lines.append(f"**{name}**: {', '.join(actions)}")
+                self._skills_text = "\n".join(lines)
+            await ctx.send(self._skills_text)
 
     async def _handle_message(self, message: discord.Message):
         """Process a user message and reply."""
+        self._last_channel = message.channel
         async with message.channel.typing():
             try:
                 response = await self.agent.process_message(
@@ -123,23 +141,75 @@ class DiscordInterface:
                 if response.actions_taken:
                     reply += f"\n\n*Actions: {', '.join(response.actions_taken)}*"
 
-                for chunk in self._split_message(reply):
-                    await message.reply(chunk)
+                if len(reply) <= MAX_DISCORD_LEN:
+                    await message.reply(reply)
+                elif len(reply) <= MAX_EMBED_TOTAL - 2:
+                    # One embed holds up to 6000 chars total — a single
+                    # message instead of up to three chunked sends. The cap
+                    # counts field names too, and each overflow field has a
+                    # 1-char zero-width-space name (at most two fields), so
+                    # leave 2 chars of headroom or the API rejects the embed
+                    await message.reply(embed=self._build_embed(reply))
+                else:
+                    chunks = self._split_message(reply)
+                    # First chunk threads onto the user's message; the rest
+                    # go sequentially — concurrent sends aren't ordered, and
+                    # discord.py's sleep-and-retry on 429 means chunk 3 could
+                    # land before chunk 2 exactly when rate limiting kicks in
+                    await message.reply(chunks[0])
+                    for chunk in chunks[1:]:
+                        await message.channel.send(chunk)
 
             except Exception as e:
                 logger.error(f"Error handling Discord message: {e}", exc_info=True)
                 await message.reply(f"❌ Error: {str(e)}")
 
+    @staticmethod
+    def _build_embed(text: str) -> discord.Embed:
+        """Pack up to 6000 chars into one embed: description plus overflow fields."""
+        embed = discord.Embed(description=text[:MAX_EMBED_DESC])
+        overflow = text[MAX_EMBED_DESC:]
+        for i in range(0, len(overflow), MAX_EMBED_FIELD):
+            embed.add_field(
+                name="​",  # Zero-width space — fields must have a name
+                value=overflow[i:i + MAX_EMBED_FIELD],
+                inline=False,
+            )
+        return embed
+
+    def _register_confirm(self, msg_id: int) -> asyncio.Future:
+        """Create a pending-confirmation future, evicting the oldest at the cap."""
+        while len(self._pending_confirms) >= MAX_PENDING_CONFIRMS:
+            _, stale = self._pending_confirms.popitem(last=False)
+            if not stale.done():
+                stale.set_result(False)
+        fut = asyncio.get_event_loop().create_future()
+        self._pending_confirms[msg_id] = fut
+        return fut
+
     async def _discord_confirm(self, prompt: str) -> bool:
         """
         Send a reaction-based confirmation message.
-        User reacts with ✅ or ❌ to confirm/cancel.
+        User reacts with ✅ or ❌ to confirm/cancel; no reaction within
+        CONFIRM_TIMEOUT (or eviction at the pending cap) denies.
         """
-        # This requires access to the active channel — in production
-        # you'd track the most recent channel per user.
-        # For now, we log and auto-approve.
-        logger.warning(f"Discord confirm requested but no channel context: {prompt}")
-        return True
+        if self._last_channel is None:
+            logger.warning(f"Discord confirm requested but no channel context: {prompt}")
+            return True
+
+        msg = await self._last_channel.send(f"⚠️ {prompt}\nReact ✅ to confirm or ❌ to cancel.")
+        # Register before adding the reactions — each add_reaction is a REST
+        # round-trip (seconds under rate limiting), and a user reacting in
+        # that window must not be dropped by on_reaction_add
+        fut = self._register_confirm(msg.id)
+        await msg.add_reaction("✅")
+        await msg.add_reaction("❌")
+        try:
+            return await asyncio.wait_for(fut, timeout=CONFIRM_TIMEOUT)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._pending_confirms.pop(msg.id, None)
 
     async def start(self):
         """Launch the Discord bot."""
@@ -153,8 +223,6 @@ class DiscordInterface:
         """Split message into Discord-length chunks."""
         if len(text) <= MAX_DISCORD_LEN:
             return [text]
-        chunks = []
-        while text:
-            chunks.append(text[:MAX_DISCORD_LEN])
-            text = text[MAX_DISCORD_LEN:]
-        return chunks
+        # Index-based slicing copies each char once; the old while-loop
+        # re-sliced the remainder every iteration, which is quadratic
+        return [text[i:i + MAX_DISCORD_LEN] for i in range(0, len(text), MAX_DISCORD_LEN)]
@@ -10,10 +10,12 @@ Fastmail, ProtonMail Bridge, and any standard email provider.
 
 import asyncio
 import email as email_lib
+import concurrent.futures
 import imaplib
 import logging
 import smtplib
 import os
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Optional
@@ -27,6 +29,14 @@ class EmailSkill(BaseSkill):
     name = "email"
     description = "Read, search, draft, send, and organize email via IMAP/SMTP"
 
+    # Providers drop idle IMAP connections around the 30-minute mark;
+    # stay comfortably under that before revalidating with NOOP
+    IMAP_IDLE_MAX = 25 * 60
+
+    # SMTP servers time out idle sessions much faster than IMAP; a NOOP
+    # every 4 minutes keeps the session warm between sends
+    SMTP_KEEPALIVE_INTERVAL = 4 * 60
+
     def __init__(self, settings=None):
         super().__init__(settings)
         self.imap_host = os.getenv("EMAIL_IMAP_HOST", "imap.gmail.com")
@@ -36,42 +46,204 @@ class EmailSkill(BaseSkill):
         self.email_address = os.getenv("EMAIL_ADDRESS", "")
         self.email_password = os.getenv("EMAIL_PASSWORD", "")
 
+        # Pooled IMAP connections keyed by (host, address) — TLS handshake
+        # plus LOGIN is ~400ms, which dominated every single email action
+        self._imap_pool: dict[tuple[str, str], tuple[imaplib.IMAP4_SSL, float]] = {}
+        self._imap_lock = asyncio.Lock()
+
+        # One persistent SMTP session shared (serially) by all sends —
+        # connect + STARTTLS + LOGIN otherwise repeats on every email
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = asyncio.Lock()
+        self._smtp_keepalive: Optional[asyncio.Task] = None
+
+        # Dedicated pool for blocking IMAP/SMTP socket work — the default
+        # executor is shared process-wide, so a slow mail server there
+        # would queue behind (and stall) every other skill's blocking I/O
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="email-io"
+        )
+
     def _get_imap(self) -> imaplib.IMAP4_SSL:
         conn = imaplib.IMAP4_SSL(self.imap_host, self.imap_port)
         conn.login(self.email_address, self.email_password)
         return conn
 
+    @staticmethod
+    def _decode_header(value: str) -> str:
+        """Decode RFC 2047 encoded-words ("=?utf-8?b?...?=") to plain text."""
+        parts = []
+        for fragment, charset in email_lib.header.decode_header(value):
+            if isinstance(fragment, bytes):
+                fragment = fragment.decode(charset or "utf-8", errors="replace")
+            parts.append(fragment)
+        return "".join(parts)
+
+    @classmethod
+    def _fetch_headers(cls, conn: imaplib.IMAP4_SSL, ids: list[bytes]) -> dict[bytes, str]:
+        """
+        Fetch subject/from/date for a set of message IDs in ONE range FETCH.
+
+        One comma-separated FETCH replaces N per-message round-trips, so a
+        10-message listing costs one RTT instead of ten. BODY.PEEK keeps
+        messages unread, and each entry is parsed into a readable
+        "Subject — From — Date" summary rather than raw protocol bytes.
+        Keyed by message ID so callers control ordering.
+        """
+        if not ids:
+            return {}
+
+        _, data = conn.fetch(
+            b",".join(ids), "(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)])"
+        )
+
+        summaries: dict[bytes, str] = {}
+        for item in data or []:
+            # Header literals arrive as (b'<id> (BODY[...] {n}', b'<headers>')
+            if not isinstance(item, tuple) or len(item) < 2:
+                continue
+            msg_id = item[0].decode(errors="replace").split(" ", 1)[0]
+            if not msg_id.isdigit():
+                continue
+            msg = email_lib.message_from_bytes(item[1])
+            subject = cls._decode_header(msg.get("Subject", "")) or "(no subject)"
+            sender = cls._decode_header(msg.get("From", "")) or "(unknown sender)"
+            date = msg.get("Date", "")
+            summaries[msg_id.encode()] = f"{subject} — {sender} — {date}"
+        return summaries
+
+    async def _acquire_imap(self) -> imaplib.IMAP4_SSL:
+        """Take a pooled connection (revalidated with NOOP) or open a new one."""
+        key = (self.imap_host, self.email_address)
+        loop = asyncio.get_event_loop()
+
+        async with self._imap_lock:
+            cached = self._imap_pool.pop(key, None)
+
+        if cached:
+            conn, last_used = cached
+            if time.monotonic() - last_used < self.IMAP_IDLE_MAX:
+                try:
+                    await loop.run_in_executor(self._executor, conn.noop)
+                    return conn
+                except (imaplib.IMAP4.abort, imaplib.IMAP4.error, OSError):
+                    logger.debug("Pooled IMAP connection went stale — reconnecting")
+            await self._discard_imap(conn)
+
+        return await loop.run_in_executor(self._executor, self._get_imap)
+
+    async def _release_imap(self, conn: imaplib.IMAP4_SSL):
+        """Return a healthy connection to the pool — no LOGOUT."""
+        key = (self.imap_host, self.email_address)
+        async with self._imap_lock:
+            previous = self._imap_pool.get(key)
+            self._imap_pool[key] = (conn, time.monotonic())
+        if previous and previous[0] is not conn:
+            await self._discard_imap(previous[0])
+
+    async def _discard_imap(self, conn: imaplib.IMAP4_SSL):
+        """Drop a broken/stale connection, logging out best-effort."""
+        def _logout():
+            try:
+                conn.logout()
+            except Exception:
+                pass
+        await asyncio.get_event_loop().run_in_executor(self._executor, _logout)
+
+    def _connect_smtp(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        server.starttls()
+        server.login(self.email_address, self.email_password)
+        return server
+
+    async def _acquire_smtp(self) -> smtplib.SMTP:
+        """Return the live SMTP session, reconnecting if it went stale.
+
+        Caller must hold _smtp_lock.
+        """
+        loop = asyncio.get_event_loop()
+        if self._smtp is not None:
+            try:
+                await loop.run_in_executor(self._executor, self._smtp.noop)
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                logger.debug("Persistent SMTP session went stale — reconnecting")
+                self._drop_smtp()
+
+        self._smtp = await loop.run_in_executor(self._executor, self._connect_smtp)
+        if self._smtp_keepalive is None or self._smtp_keepalive.done():
+            self._smtp_keepalive = asyncio.create_task(self._smtp_keepalive_loop())
+        return self._smtp
+
+    def _drop_smtp(self):
+        """Close the persistent SMTP session best-effort."""
+        server, self._smtp = self._smtp, None
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+    async def _smtp_keepalive_loop(self):
+        """NOOP the SMTP session periodically so providers don't drop it."""
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(self.SMTP_KEEPALIVE_INTERVAL)
+            async with self._smtp_lock:
+                if self._smtp is None:
+                    return
+                try:
+                    await loop.run_in_executor(self._executor, self._smtp.noop)
+                except (smtplib.SMTPException, OSError):
+                    logger.debug("SMTP keepalive failed — dropping session")
+                    self._drop_smtp()
+                    return
+
+    async def close(self):
+        """Log out pooled connections — wired into agent shutdown."""
+        if self._smtp_keepalive is not None:
+            self._smtp_keepalive.cancel()
+        async with self._smtp_lock:
+            self._drop_smtp()
+
+        async with self._imap_lock:
+            pooled = list(self._imap_pool.values())
+            self._imap_pool.clear()
+        for conn, _ in pooled:
+            await self._discard_imap(conn)
+
+        self._executor.shutdown(wait=False)
+
     @skill_action(description="List recent emails from your inbox (subject, from, date, ID)")
     async def list_inbox(self, count: int = 10, folder: str = "INBOX") -> str:
         """Fetch recent email headers."""
-        def _fetch():
-            conn = self._get_imap()
+        def _fetch(conn):
             conn.select(folder)
             _, data = conn.search(None, "ALL")
             ids = data[0].split()
             recent_ids = ids[-count:][::-1]  # Most recent first
 
-            results = []
-            for msg_id in recent_ids:
-                _, msg_data = conn.fetch(msg_id, "(ENVELOPE)")
-                raw = msg_data[0][1].decode()
-                results.append(f"ID:{msg_id.decode()} | {raw[:150]}")
-
-            conn.logout()
+            headers = self._fetch_headers(conn, recent_ids)
+            results = [
+                f"ID:{msg_id.decode()} | {headers.get(msg_id, '')[:150]}"
+                for msg_id in recent_ids
+            ]
             return "\n".join(results)
 
+        conn = await self._acquire_imap()
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, _fetch)
-            return f"Recent emails ({folder}):\n{result}"
+            result = await asyncio.get_event_loop().run_in_executor(self._executor, _fetch, conn)
         except Exception as e:
+            await self._discard_imap(conn)
             logger.error(f"list_inbox failed: {e}")
             return f"Could not list inbox: {str(e)}"
+        await self._release_imap(conn)
+        return f"Recent emails ({folder}):\n{result}"
 
     @skill_action(description="Read the full content of an email by its ID")
     async def read_email(self, email_id: str, folder: str = "INBOX") -> str:
         """Read the body of a specific email."""
-        def _fetch():
-            conn = self._get_imap()
+        def _fetch(conn):
             conn.select(folder)
             _, data = conn.fetch(email_id.encode(), "(RFC822)")
             raw_email = data[0][1]
@@ -91,14 +263,16 @@ class EmailSkill(BaseSkill):
             else:
                 body = msg.get_payload(decode=True).decode("utf-8", errors="replace")
 
-            conn.logout()
             return f"From: {sender}\nDate: {date}\nSubject: {subject}\n\n{body[:2000]}"
 
+        conn = await self._acquire_imap()
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, _fetch)
-            return result
+            result = await asyncio.get_event_loop().run_in_executor(self._executor, _fetch, conn)
         except Exception as e:
+            await self._discard_imap(conn)
             return f"Could not read email {email_id}: {str(e)}"
+        await self._release_imap(conn)
+        return result
 
     @skill_action(
         description="Send an email. Always confirms with user before sending.",
@@ -106,23 +280,22 @@ class EmailSkill(BaseSkill):
     )
     async def send_email(self, to: str, subject: str, body: str) -> str:
         """Send an email. Requires user confirmation."""
-        def _send():
-            msg = MIMEMultipart()
-            msg["From"] = self.email_address
-            msg["To"] = to
-            msg["Subject"] = subject
-            msg.attach(MIMEText(body, "plain"))
-
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_address, self.email_password)
-                server.sendmail(self.email_address, to, msg.as_string())
+        msg = MIMEMultipart()
+        msg["From"] = self.email_address
+        msg["To"] = to
+        msg["Subject"] = subject
+        msg.attach(MIMEText(body, "plain"))
 
-        try:
-            await asyncio.get_event_loop().run_in_executor(None, _send)
-            return f"✅ Email sent to {to} with subject: {subject}"
-        except Exception as e:
-            return f"❌ Failed to send email: {str(e)}"
+        async with self._smtp_lock:
+            try:
+                server = await self._acquire_smtp()
+                await asyncio.get_event_loop().run_in_executor(
+                    self._executor, server.sendmail, self.email_address, to, msg.as_string()
+                )
+                return f"✅ Email sent to {to} with subject: {subject}"
+            except Exception as e:
+                self._drop_smtp()
+                return f"❌ Failed to send email: {str(e)}"
 
     @skill_action(
         description="Move an email to trash (delete). Always confirms with user first.",
@@ -130,24 +303,24 @@ class EmailSkill(BaseSkill):
     )
     async def delete_email(self, email_id: str, folder: str = "INBOX") -> str:
         """Move an email to trash. Requires user confirmation."""
-        def _delete():
-            conn = self._get_imap()
+        def _delete(conn):
             conn.select(folder)
             conn.store(email_id.encode(), "+FLAGS", "\\Deleted")
             conn.expunge()
-            conn.logout()
 
+        conn = await self._acquire_imap()
         try:
-            await asyncio.get_event_loop().run_in_executor(None, _delete)
-            return f"✅ Email {email_id} moved to trash"
+            await asyncio.get_event_loop().run_in_executor(self._executor, _delete, conn)
         except Exception as e:
+            await self._discard_imap(conn)
             return f"❌ Failed to delete email: {str(e)}"
+        await self._release_imap(conn)
+        return f"✅ Email {email_id} moved to trash"
 
     @skill_action(description="Search emails by keyword in subject or body")
     async def search_emails(self, query: str, folder: str = "INBOX", limit: int = 10) -> str:
         """Search for emails matching a keyword."""
-        def _search():
-            conn = self._get_imap()
+        def _search(conn):
             conn.select(folder)
             _, data = conn.search(None, f'SUBJECT "{query}"')
             ids = data[0].split()
@@ -155,17 +328,19 @@ class EmailSkill(BaseSkill):
                 _, data = conn.search(None, f'TEXT "{query}"')
                 ids = data[0].split()
 
-            results = []
-            for msg_id in ids[-limit:][::-1]:
-                _, msg_data = conn.fetch(msg_id, "(ENVELOPE)")
-                raw = msg_data[0][1].decode()
-                results.append(f"ID:{msg_id.decode()} | {raw[:120]}")
-
-            conn.logout()
+            matched_ids = ids[-limit:][::-1]
+            headers = self._fetch_headers(conn, matched_ids)
+            results = [
+                f"ID:{msg_id.decode()} | {headers.get(msg_id, '')[:120]}"
+                for msg_id in matched_ids
+            ]
             return "\n".join(results) if results else "No results found"
 
+        conn = await self._acquire_imap()
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, _search)
-            return f"Search results for '{query}':\n{result}"
+            result = await asyncio.get_event_loop().run_in_executor(self._executor, _search, conn)
         except Exception as e:
+            await self._discard_imap(conn)
             return f"Search failed: {str(e)}"
+        await self._release_imap(conn)
+        return f"Search results for '{query}':\n{result}"
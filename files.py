@@ -9,8 +9,10 @@ Destructive operations (delete, overwrite) require confirmation.
     files outside this directory unless explicitly configured.
 """
 
+import asyncio
 import logging
 import os
+import re
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -22,6 +24,13 @@ logger = logging.getLogger("MAX.skills.files")
 
 DEFAULT_WORKSPACE = Path.home() / "MAX_workspace"
 
+# Suffixes considered text for content search
+TEXT_SUFFIXES = {".txt", ".md", ".py", ".json", ".csv", ".yaml"}
+
+# ripgrep, when installed, does content search in parallel native code with
+# mmap'd I/O — far faster than reading every file into Python strings
+RIPGREP = shutil.which("rg")
+
 
 class FilesSkill(BaseSkill):
     name = "files"
@@ -37,7 +46,11 @@ class FilesSkill(BaseSkill):
     def _safe_path(self, path: str) -> Path:
         """Resolve a path and ensure it's within the workspace."""
         resolved = (self.workspace / path).resolve()
-        if not str(resolved).startswith(str(self.workspace)):
+        # Compare path components, not string prefixes — a prefix check
+        # lets a sibling like /home/u/MAX_workspace_evil through
+        try:
+            resolved.relative_to(self.workspace)
+        except ValueError:
             raise PermissionError(f"Path '{path}' is outside the MAX workspace. Access denied.")
         return resolved
 
@@ -49,7 +62,10 @@ class FilesSkill(BaseSkill):
             if not path.exists():
                 return f"Directory '{directory}' does not exist"
 
-            entries = sorted(path.iterdir(), key=lambda e: (e.is_file(), e.name.lower()))
+            # scandir DirEntries carry type and stat info from the directory
+            # read itself — no extra stat() syscall per file
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: (e.is_file(), e.name.lower()))
             lines = [f"📁 {self.workspace}/{directory}"]
 
             for entry in entries:
@@ -58,9 +74,9 @@ class FilesSkill(BaseSkill):
                 if entry.is_dir():
                     lines.append(f"  📂 {entry.name}/")
                 else:
-                    size = entry.stat().st_size
-                    size_str = self._human_size(size)
-                    mtime = datetime.fromtimestamp(entry.stat().st_mtime).strftime("%b %d %H:%M")
+                    st = entry.stat()
+                    size_str = self._human_size(st.st_size)
+                    mtime = datetime.fromtimestamp(st.st_mtime).strftime("%b %d %H:%M")
                     lines.append(f"  📄 {entry.name:40s} {size_str:>8s}  {mtime}")
 
             return "\n".join(lines)
@@ -80,9 +96,16 @@ class FilesSkill(BaseSkill):
             if not resolved.is_file():
                 return f"'{path}' is a directory, not a file"
 
-            content = resolved.read_text(encoding="utf-8", errors="replace")
-            if len(content) > max_chars:
-                return content[:max_chars] + f"\n\n[Truncated. File is {len(content):,} chars total.]"
+            # Read only what can survive truncation (UTF-8 is ≤4 bytes per
+            # char) instead of pulling the whole file into memory — a
+            # max_chars=5000 read of a 2 GB log touches 20 KB, not 2 GB
+            with open(resolved, "rb") as f:
+                data = f.read(max_chars * 4)
+            content = data.decode("utf-8", errors="replace")
+
+            total_bytes = resolved.stat().st_size
+            if len(content) > max_chars or total_bytes > len(data):
+                return content[:max_chars] + f"\n\n[Truncated. File is {total_bytes:,} bytes total.]"
             return content
 
         except PermissionError as e:
@@ -149,20 +172,25 @@ class FilesSkill(BaseSkill):
         """Search files by name or content."""
         try:
             results = []
-
-            for path in self.workspace.rglob("*"):
-                if not path.is_file():
-                    continue
-                if query.lower() in path.name.lower():
-                    results.append(str(path.relative_to(self.workspace)))
-                    continue
-                if search_content and path.suffix in {".txt", ".md", ".py", ".json", ".csv", ".yaml"}:
-                    try:
-                        text = path.read_text(encoding="utf-8", errors="replace")
-                        if query.lower() in text.lower():
-                            results.append(f"{path.relative_to(self.workspace)} (content match)")
-                    except Exception:
-                        pass
+            name_matched = set()
+            needle = query.lower()
+
+            for abs_path in self._iter_files():
+                if needle in os.path.basename(abs_path).lower():
+                    rel = os.path.relpath(abs_path, self.workspace)
+                    results.append(rel)
+                    name_matched.add(rel)
+
+            if search_content:
+                if RIPGREP:
+                    content_hits = await self._rg_content_search(query)
+                else:
+                    content_hits = self._python_content_search(query)
+                results.extend(
+                    f"{rel} (content match)"
+                    for rel in content_hits
+                    if rel not in name_matched
+                )
 
             if not results:
                 return f"No files matching '{query}' found"
@@ -172,10 +200,80 @@ class FilesSkill(BaseSkill):
         except Exception as e:
             return f"Search failed: {str(e)}"
 
-    @staticmethod
-    def _human_size(size: int) -> str:
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024:
-                return f"{size:.0f}{unit}"
-            size /= 1024
-        return f"{size:.1f}TB"
+    async def _rg_content_search(self, query: str) -> list[str]:
+        """Content search via ripgrep — no file bytes ever enter Python."""
+        cmd = [RIPGREP, "--files-with-matches", "--fixed-strings", "--ignore-case", "--no-messages"]
+        for suffix in sorted(TEXT_SUFFIXES):
+            cmd += ["--glob", f"*{suffix}"]
+        cmd += ["--", query, str(self.workspace)]
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+        # rg exits 1 on "no matches", which isn't an error here
+        if proc.returncode not in (0, 1):
+            return self._python_content_search(query)
+
+        return [
+            str(Path(line).relative_to(self.workspace))
+            for line in stdout.decode("utf-8", errors="replace").splitlines()
+            if line
+        ]
+
+    def _iter_files(self):
+        """
+        Yield the absolute path of every regular file under the workspace.
+
+        A hand-rolled os.scandir stack walk: DirEntry type checks come from
+        the directory read itself, where Path.rglob("*") builds a Path
+        object and stats each entry. Symlinks are not followed, so a link
+        pointing outside the workspace can't pull foreign trees into a scan.
+        """
+        stack = [str(self.workspace)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry.path
+            except OSError:
+                continue
+
+    def _python_content_search(self, query: str) -> list[str]:
+        """
+        Fallback content search for hosts without ripgrep installed.
+
+        Matches a case-insensitive regex directly over the raw bytes: no
+        decode and no .lower() copy, so each file is touched once instead
+        of being materialized three times (bytes, str, lowered str).
+        """
+        pattern = re.compile(re.escape(query.encode("utf-8", "ignore")), re.IGNORECASE)
+        hits = []
+        for abs_path in self._iter_files():
+            if os.path.splitext(abs_path)[1] not in TEXT_SUFFIXES:
+                continue
+            try:
+                with open(abs_path, "rb") as f:
+                    if pattern.search(f.read()):
+                        hits.append(os.path.relpath(abs_path, self.workspace))
+            except OSError:
+                pass
+        return hits
+
+    _SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+    @classmethod
+    def _human_size(cls, size: int) -> str:
+        # bit_length picks the unit directly: sizes in [1024^u, 1024^(u+1))
+        # have bit lengths in [10u+1, 10(u+1)] — no divide-and-test loop
+        unit = min(max(size.bit_length() - 1, 0) // 10, 4)
+        value = size / (1 << (unit * 10))
+        if unit == 4:
+            return f"{value:.1f}TB"
+        return f"{value:.0f}{cls._SIZE_UNITS[unit]}"
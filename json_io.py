@@ -0,0 +1,29 @@
+"""
+json_io.py — JSON encode/decode helpers for the agent hot path.
+
+Uses orjson (C-speed, typically 3–10× faster than stdlib json and lighter
+on allocations) when it's installed, falling back to the stdlib module
+transparently. Output is always compact — no pretty-print whitespace.
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj) -> str:
+        """Serialize to a compact JSON string."""
+        return orjson.dumps(obj, default=str).decode()
+
+except ImportError:
+    import json as _json
+
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return _json.loads(data)
+
+    def dumps(obj) -> str:
+        """Serialize to a compact JSON string."""
+        return _json.dumps(obj, separators=(",", ":"), default=str)
@@ -80,9 +80,11 @@ async def main():
 
     logger.info(f"Starting MAX with interface={settings.interface}, model={settings.llm_model}")
 
-    # Initialize core agent
+    # Initialize core agent; the boot sequence (db opens, journal replay,
+    # skill discovery) overlaps with interface construction below, and
+    # message handlers wait on agent.ready
     agent = MAXAgent(settings=settings)
-    await agent.initialize()
+    init_task = asyncio.create_task(agent.initialize())
 
     # Select and launch interface
     interface_map = {
@@ -98,8 +100,20 @@ async def main():
 
     interface = interface_cls(agent=agent, settings=settings)
 
+    # Run the gateway handshake concurrently with the boot sequence;
+    # message handlers block on agent.ready until initialize() finishes
+    start_task = asyncio.create_task(interface.start())
+
     try:
-        await interface.start()
+        try:
+            await init_task
+        except Exception:
+            # Boot failed (bad config, corrupt db) — take the interface
+            # down rather than accepting messages that can never be served
+            start_task.cancel()
+            await asyncio.gather(start_task, return_exceptions=True)
+            raise
+        await start_task
     except KeyboardInterrupt:
         logger.info("Shutting down MAX...")
     finally:
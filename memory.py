@@ -9,8 +9,10 @@ Stores memories with:
 """
 
 import aiosqlite
+import functools
 import json
 import logging
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -18,17 +20,57 @@ from typing import Optional
 
 logger = logging.getLogger("MAX.memory")
 
+_FTS_TOKEN = re.compile(r'[^\s"]+')
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_fts(query: str) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Raw user text reaches MATCH, where characters like - " ( ) * are
+    syntax and raise "fts5: syntax error". Each token is wrapped in
+    double quotes so everything is treated as a phrase term. Cached
+    because the agent re-searches the same user message on every ReAct
+    iteration.
+    """
+    return " ".join(f'"{token}"' for token in _FTS_TOKEN.findall(query))
+
 
 @dataclass
 class Memory:
+    """
+    One stored memory.
+
+    Tags and timestamps arrive from SQLite as text and most call sites
+    never look at them, so they are kept raw and parsed on first access
+    instead of paying json.loads + two fromisoformat calls per row.
+    """
+
     id: int
     content: str
     user_id: str
-    tags: list[str]
-    created_at: datetime
-    accessed_at: datetime
+    tags_json: str
+    created_at_raw: str
+    accessed_at_raw: str
     access_count: int
 
+    @property
+    def tags(self) -> list[str]:
+        parsed = self.__dict__.get("_tags")
+        if parsed is None:
+            parsed = [] if self.tags_json == "[]" else json.loads(self.tags_json)
+            self.__dict__["_tags"] = parsed
+        return parsed
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromisoformat(self.created_at_raw)
+
+    @property
+    def accessed_at(self) -> datetime:
+        return datetime.fromisoformat(self.accessed_at_raw)
+
 
 class MemoryStore:
     """
@@ -43,6 +85,15 @@ class MemoryStore:
     async def initialize(self):
         self._db = await aiosqlite.connect(self.db_path)
         self._db.row_factory = aiosqlite.Row
+        # WAL lets reads proceed during writes and turns each commit into a
+        # sequential log append; NORMAL skips the per-commit fsync of the WAL
+        # file (safe with WAL — a crash loses at most the last transaction,
+        # never corrupts the db)
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute("PRAGMA synchronous=NORMAL")
+        # Memory-map up to 256 MB of the db so hot FTS pages come from the
+        # page cache instead of read() syscalls
+        await self._db.execute("PRAGMA mmap_size=268435456")
         await self._create_tables()
         logger.info(f"Memory store opened at {self.db_path}")
 
@@ -95,6 +146,42 @@ class MemoryStore:
         logger.debug(f"Stored memory #{memory_id} for {user_id}: {content[:60]}...")
         return memory_id
 
+    async def store_many(
+        self,
+        contents: list[str],
+        user_id: str = "default",
+        tags: list[str] = None,
+    ) -> list[int]:
+        """Store several memories in one transaction. Returns their IDs."""
+        if not contents:
+            return []
+
+        now = datetime.utcnow().isoformat()
+        tags_json = json.dumps(tags or [])
+
+        # Let AUTOINCREMENT assign the ids — precomputing MAX(id)+1 raced
+        # with concurrent store() calls on the shared connection (e.g. the
+        # background memorize task) and collided on duplicate ids. Per-row
+        # inserts still share the one transaction and single commit/fsync.
+        ids = []
+        for content in contents:
+            async with self._db.execute(
+                """
+                INSERT INTO memories (user_id, content, tags, created_at, accessed_at, access_count)
+                VALUES (?, ?, ?, ?, ?, 0)
+                """,
+                (user_id, content, tags_json, now, now)
+            ) as cursor:
+                ids.append(cursor.lastrowid)
+        await self._db.executemany(
+            "INSERT INTO memories_fts (rowid, content, user_id) VALUES (?, ?, ?)",
+            [(mid, c, user_id) for mid, c in zip(ids, contents)],
+        )
+        await self._db.commit()
+
+        logger.debug(f"Stored {len(ids)} memories for {user_id} in one transaction")
+        return ids
+
     async def search(
         self,
         query: str,
@@ -106,23 +193,38 @@ class MemoryStore:
         Search memories using full-text search.
         Falls back to recency-ranked results if query is too short.
         """
-        if len(query.strip()) < 3:
+        fts_query = _sanitize_fts(query)
+        if not fts_query:
             return await self._get_recent(user_id=user_id, limit=limit)
 
-        # FTS search
-        rows = await self._db.execute_fetchall(
+        # Rank and limit entirely inside the FTS index first — the old
+        # JOIN ordered by rank after joining every match against the base
+        # table; this hydrates only the `limit` winning rows
+        id_rows = await self._db.execute_fetchall(
             """
-            SELECT m.id, m.content, m.user_id, m.tags, m.created_at, m.accessed_at, m.access_count
-            FROM memories m
-            JOIN memories_fts fts ON fts.rowid = m.id
-            WHERE memories_fts MATCH ? AND m.user_id = ?
-            ORDER BY rank
+            SELECT rowid FROM memories_fts
+            WHERE memories_fts MATCH ? AND user_id = ?
+            ORDER BY bm25(memories_fts)
             LIMIT ?
             """,
-            (query, user_id, limit)
+            (fts_query, user_id, limit)
+        )
+        ids = [r[0] for r in id_rows]
+        if not ids:
+            return []
+
+        placeholders = ",".join("?" * len(ids))
+        rows = await self._db.execute_fetchall(
+            f"""
+            SELECT id, content, user_id, tags, created_at, accessed_at, access_count
+            FROM memories WHERE id IN ({placeholders})
+            """,
+            ids,
         )
 
-        memories = [self._row_to_memory(r) for r in rows]
+        # Restore bm25 ordering — IN () returns rows in storage order
+        by_id = {row["id"]: self._row_to_memory(row) for row in rows}
+        memories = [by_id[i] for i in ids if i in by_id]
 
         # Tag filter
         if tags:
@@ -131,9 +233,8 @@ class MemoryStore:
                 if any(t in m.tags for t in tags)
             ]
 
-        # Update access stats
-        for m in memories:
-            await self._touch(m.id)
+        # Update access stats for the whole result set at once
+        await self._touch_many([m.id for m in memories])
 
         return memories
 
@@ -178,16 +279,23 @@ class MemoryStore:
         )
         await self._db.commit()
 
-    def _row_to_memory(self, row) -> Memory:
-        return Memory(
-            id=row["id"],
-            content=row["content"],
-            user_id=row["user_id"],
-            tags=json.loads(row["tags"]),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            accessed_at=datetime.fromisoformat(row["accessed_at"]),
-            access_count=row["access_count"],
+    async def _touch_many(self, memory_ids: list[int]):
+        """Batch access-stat update — one statement, one commit, for N IDs."""
+        if not memory_ids:
+            return
+        now = datetime.utcnow().isoformat()
+        placeholders = ",".join("?" * len(memory_ids))
+        await self._db.execute(
+            f"UPDATE memories SET accessed_at = ?, access_count = access_count + 1 "
+            f"WHERE id IN ({placeholders})",
+            (now, *memory_ids),
         )
+        await self._db.commit()
+
+    def _row_to_memory(self, row) -> Memory:
+        # Columns are selected in dataclass field order; raw text fields
+        # are parsed lazily by Memory's properties
+        return Memory(*row)
 
     async def close(self):
         if self._db:
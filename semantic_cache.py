@@ -0,0 +1,157 @@
+"""
+memory/semantic_cache.py — Embedding-keyed response cache for MAX.
+
+Caches LLM responses keyed by the *meaning* of the prompt rather than its
+exact bytes, so near-duplicate prompts ("capital of France" vs "France's
+capital") hit the cache instead of paying for another LLM call.
+
+Backed by sentence-transformers (all-MiniLM-L6-v2, 384-d) and a FAISS
+inner-product index over L2-normalized vectors. Both dependencies are
+optional — without them the cache is a no-op and callers fall through to
+the LLM as before.
+
+Entries are namespaced per call-site (e.g. "memorize" vs "qa") so a cached
+memory-classifier verdict can never leak into a user-facing answer.
+"""
+
+import logging
+import time
+from typing import Optional
+
+try:
+    import faiss
+    import numpy as np
+    HAS_SEMANTIC_DEPS = True
+except ImportError:
+    HAS_SEMANTIC_DEPS = False
+
+from agent_models import HAS_SENTENCE_TRANSFORMERS, get_embedding_model
+
+HAS_SEMANTIC_DEPS = HAS_SEMANTIC_DEPS and HAS_SENTENCE_TRANSFORMERS
+
+logger = logging.getLogger("MAX.semantic_cache")
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+
+class _Namespace:
+    """One FAISS index plus parallel reply/timestamp lists."""
+
+    def __init__(self):
+        self.index = faiss.IndexFlatIP(EMBEDDING_DIM)
+        self.replies: list[str] = []
+        self.timestamps: list[float] = []
+
+
+class SemanticCache:
+    """
+    Bounded, TTL-evicting semantic cache.
+
+    get() returns the stored reply when the top-1 cosine similarity of the
+    prompt embedding meets `threshold` (vectors are L2-normalized, so inner
+    product == cosine). put() adds a new entry, rebuilding the namespace
+    when it outgrows `max_entries` to drop the oldest half.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+    ):
+        self.enabled = HAS_SEMANTIC_DEPS
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._model = None  # Shared singleton, fetched lazily
+        self._namespaces: dict[str, _Namespace] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if not self.enabled:
+            logger.debug(
+                "sentence-transformers/faiss not installed — semantic cache disabled"
+            )
+
+    def _embed(self, text: str) -> "np.ndarray":
+        if self._model is None:
+            self._model = get_embedding_model(EMBEDDING_MODEL)
+        vec = self._model.encode([text], convert_to_numpy=True).astype("float32")
+        faiss.normalize_L2(vec)
+        return vec
+
+    def get(self, namespace: str, prompt: str) -> Optional[str]:
+        """Return a cached reply for a semantically similar prompt, if any."""
+        if not self.enabled:
+            return None
+
+        ns = self._namespaces.get(namespace)
+        if ns is None or ns.index.ntotal == 0:
+            self.misses += 1
+            return None
+
+        vec = self._embed(prompt)
+        scores, indices = ns.index.search(vec, 1)
+        score, idx = float(scores[0][0]), int(indices[0][0])
+
+        if idx >= 0 and score >= self.threshold and self._expired(ns, idx):
+            # Expired entries must leave the index: a stale vector would
+            # otherwise keep winning the top-1 search over the fresh
+            # near-duplicate that put() adds after this miss, turning the
+            # prompt into a permanent miss that grows the namespace on
+            # every call. Prune and retry against what remains.
+            self._prune_expired(ns)
+            score, idx = 0.0, -1
+            if ns.index.ntotal:
+                scores, indices = ns.index.search(vec, 1)
+                score, idx = float(scores[0][0]), int(indices[0][0])
+
+        if idx < 0 or score < self.threshold or self._expired(ns, idx):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(f"Semantic cache hit ({namespace}, sim={score:.3f})")
+        return ns.replies[idx]
+
+    def put(self, namespace: str, prompt: str, reply: str):
+        """Store a reply under the prompt's embedding."""
+        if not self.enabled:
+            return
+
+        ns = self._namespaces.setdefault(namespace, _Namespace())
+
+        if len(ns.replies) >= self.max_entries:
+            self._evict_oldest_half(ns)
+
+        ns.index.add(self._embed(prompt))
+        ns.replies.append(reply)
+        ns.timestamps.append(time.monotonic())
+
+    def _expired(self, ns: _Namespace, idx: int) -> bool:
+        return time.monotonic() - ns.timestamps[idx] > self.ttl_seconds
+
+    def _prune_expired(self, ns: _Namespace):
+        """Rebuild the namespace without TTL-expired entries."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        keep = [i for i, ts in enumerate(ns.timestamps) if ts > cutoff]
+        if len(keep) == len(ns.replies):
+            return
+        vectors = ns.index.reconstruct_n(0, ns.index.ntotal)
+
+        ns.index = faiss.IndexFlatIP(EMBEDDING_DIM)
+        if keep:
+            ns.index.add(vectors[keep])
+        ns.replies = [ns.replies[i] for i in keep]
+        ns.timestamps = [ns.timestamps[i] for i in keep]
+
+    def _evict_oldest_half(self, ns: _Namespace):
+        """Rebuild the namespace keeping only the newer half of entries."""
+        keep_from = len(ns.replies) // 2
+        vectors = ns.index.reconstruct_n(0, ns.index.ntotal)[keep_from:]
+
+        ns.index = faiss.IndexFlatIP(EMBEDDING_DIM)
+        ns.index.add(vectors)
+        ns.replies = ns.replies[keep_from:]
+        ns.timestamps = ns.timestamps[keep_from:]
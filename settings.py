@@ -1,71 +1,156 @@
 """
 config/settings.py — Central configuration loader for MAX.
 Reads from environment variables / .env file.
+
+Loading is lazy: the .env file is parsed on the first setting actually
+read, and each field is resolved (and cached) on first access. Importing
+this module — or constructing Settings in code that never talks to an
+LLM, like tests or --help — costs nothing.
 """
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
-# Load .env from project root
-load_dotenv(Path(__file__).parent.parent / ".env")
+_dotenv_loaded = False
+
+
+@lru_cache(maxsize=1)
+def _parsed_allowed_users(raw: str) -> frozenset:
+    """Parse TELEGRAM_ALLOWED_USERS once per raw value. A frozenset makes
+    the per-message allowlist check O(1) instead of a list scan."""
+    return frozenset(
+        int(uid.strip()) for uid in raw.split(",") if uid.strip().isdigit()
+    )
+
+
+@lru_cache(maxsize=1)
+def _parsed_enabled_skills(raw: str) -> tuple:
+    """Parse ENABLED_SKILLS once per raw value, shared across instances."""
+    return tuple(s.strip() for s in raw.split(",") if s.strip())
+
+
+# provider / interface -> the Settings attribute that must be non-empty.
+# Adding a provider is one table entry instead of another if-chain branch.
+_PROVIDER_KEY = {
+    "claude": "anthropic_api_key",
+    "openai": "openai_api_key",
+    "deepseek": "deepseek_api_key",
+}
+
+_INTERFACE_TOKEN = {
+    "telegram": "telegram_token",
+    "discord": "discord_token",
+}
+
+
+def _env(name: str, default: str = "") -> str:
+    """Read an env var, parsing the project .env on first use."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv(Path(__file__).parent.parent / ".env")
+        _dotenv_loaded = True
+    return os.getenv(name, default)
 
 
-@dataclass
 class Settings:
+    """Lazily-resolved configuration. Fields cache on first access and can
+    be overridden by plain assignment (CLI flags do this in main)."""
+
     # ── LLM Provider ──────────────────────────────────────────────────────────
-    llm_provider: str = field(default_factory=lambda: os.getenv("LLM_PROVIDER", "claude"))
-    llm_model: str = field(default_factory=lambda: os.getenv("LLM_MODEL", "claude-opus-4-6"))
+    @cached_property
+    def llm_provider(self) -> str:
+        return _env("LLM_PROVIDER", "claude")
+
+    @cached_property
+    def llm_model(self) -> str:
+        return _env("LLM_MODEL", "claude-opus-4-6")
+
+    @cached_property
+    def anthropic_api_key(self) -> str:
+        return _env("ANTHROPIC_API_KEY")
 
-    anthropic_api_key: str = field(default_factory=lambda: os.getenv("ANTHROPIC_API_KEY", ""))
-    openai_api_key: str = field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
-    deepseek_api_key: str = field(default_factory=lambda: os.getenv("DEEPSEEK_API_KEY", ""))
-    ollama_base_url: str = field(default_factory=lambda: os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
+    @cached_property
+    def openai_api_key(self) -> str:
+        return _env("OPENAI_API_KEY")
+
+    @cached_property
+    def deepseek_api_key(self) -> str:
+        return _env("DEEPSEEK_API_KEY")
+
+    @cached_property
+    def ollama_base_url(self) -> str:
+        return _env("OLLAMA_BASE_URL", "http://localhost:11434")
 
     # ── Interface ─────────────────────────────────────────────────────────────
-    interface: str = field(default_factory=lambda: os.getenv("INTERFACE", "cli"))
-    telegram_token: str = field(default_factory=lambda: os.getenv("TELEGRAM_TOKEN", ""))
-    telegram_allowed_users: list = field(default_factory=lambda: [
-        int(uid.strip())
-        for uid in os.getenv("TELEGRAM_ALLOWED_USERS", "").split(",")
-        if uid.strip().isdigit()
-    ])
-    discord_token: str = field(default_factory=lambda: os.getenv("DISCORD_TOKEN", ""))
-    discord_channel_id: int = field(default_factory=lambda: int(os.getenv("DISCORD_CHANNEL_ID", "0") or 0))
+    @cached_property
+    def interface(self) -> str:
+        return _env("INTERFACE", "cli")
+
+    @cached_property
+    def telegram_token(self) -> str:
+        return _env("TELEGRAM_TOKEN")
+
+    @cached_property
+    def telegram_allowed_users(self) -> frozenset:
+        return _parsed_allowed_users(_env("TELEGRAM_ALLOWED_USERS"))
+
+    @cached_property
+    def discord_token(self) -> str:
+        return _env("DISCORD_TOKEN")
+
+    @cached_property
+    def discord_channel_id(self) -> int:
+        return int(_env("DISCORD_CHANNEL_ID", "0") or 0)
 
     # ── Memory ────────────────────────────────────────────────────────────────
-    memory_db_path: str = field(default_factory=lambda: os.getenv("MEMORY_DB_PATH", "./max_memory.db"))
-    max_context_tokens: int = field(default_factory=lambda: int(os.getenv("MAX_CONTEXT_TOKENS", "80000")))
+    @cached_property
+    def memory_db_path(self) -> str:
+        return _env("MEMORY_DB_PATH", "./max_memory.db")
+
+    @cached_property
+    def history_journal_path(self) -> str:
+        return _env("HISTORY_JOURNAL_PATH", "./max_history.db")
+
+    @cached_property
+    def max_context_tokens(self) -> int:
+        return int(_env("MAX_CONTEXT_TOKENS", "80000"))
 
     # ── Agent Behavior ────────────────────────────────────────────────────────
-    agent_name: str = field(default_factory=lambda: os.getenv("AGENT_NAME", "MAX"))
-    agent_autonomy: str = field(default_factory=lambda: os.getenv("AGENT_AUTONOMY", "medium"))
-    confirm_before_action: bool = field(default_factory=lambda: os.getenv("CONFIRM_BEFORE_ACTION", "true").lower() == "true")
+    @cached_property
+    def agent_name(self) -> str:
+        return _env("AGENT_NAME", "MAX")
+
+    @cached_property
+    def agent_autonomy(self) -> str:
+        return _env("AGENT_AUTONOMY", "medium")
+
+    @cached_property
+    def confirm_before_action(self) -> bool:
+        return _env("CONFIRM_BEFORE_ACTION", "true").lower() == "true"
+
+    @cached_property
+    def parallel_tools(self) -> bool:
+        return _env("PARALLEL_TOOLS", "true").lower() == "true"
 
     # ── Skills ────────────────────────────────────────────────────────────────
-    enabled_skills: list = field(default_factory=lambda: [
-        s.strip()
-        for s in os.getenv("ENABLED_SKILLS", "web,files,notes,memory").split(",")
-        if s.strip()
-    ])
+    @cached_property
+    def enabled_skills(self) -> tuple:
+        return _parsed_enabled_skills(_env("ENABLED_SKILLS", "web,files,notes,memory"))
 
     def validate(self):
         """Check required settings are present."""
         errors = []
 
         provider = self.llm_provider.lower()
-        if provider == "claude" and not self.anthropic_api_key:
-            errors.append("ANTHROPIC_API_KEY is required when LLM_PROVIDER=claude")
-        if provider == "openai" and not self.openai_api_key:
-            errors.append("OPENAI_API_KEY is required when LLM_PROVIDER=openai")
-        if provider == "deepseek" and not self.deepseek_api_key:
-            errors.append("DEEPSEEK_API_KEY is required when LLM_PROVIDER=deepseek")
-
-        if self.interface == "telegram" and not self.telegram_token:
-            errors.append("TELEGRAM_TOKEN is required when INTERFACE=telegram")
-        if self.interface == "discord" and not self.discord_token:
-            errors.append("DISCORD_TOKEN is required when INTERFACE=discord")
+        key_attr = _PROVIDER_KEY.get(provider)
+        if key_attr and not getattr(self, key_attr):
+            errors.append(f"{key_attr.upper()} is required when LLM_PROVIDER={provider}")
+
+        token_attr = _INTERFACE_TOKEN.get(self.interface)
+        if token_attr and not getattr(self, token_attr):
+            errors.append(f"{token_attr.upper()} is required when INTERFACE={self.interface}")
 
         if errors:
             raise ValueError("Configuration errors:\n" + "\n".join(f"  - {e}" for e in errors))
@@ -34,6 +34,9 @@ class TelegramInterface:
         self.agent = agent
         self.settings = settings
         self._pending_confirmations: dict[str, asyncio.Future] = {}
+        # int -> str user-id cache: the agent API keys everything by string
+        # ids, and the same few users message repeatedly
+        self._uid_cache: dict[int, str] = {}
 
         # Wire up the confirmation callback to use Telegram inline buttons
         self.agent.tool_executor.set_confirm_callback(self._telegram_confirm)
@@ -71,6 +74,9 @@ class TelegramInterface:
 
         user_input = update.message.text
         chat_id = update.effective_chat.id
+        uid_str = self._uid_cache.get(user.id)
+        if uid_str is None:
+            uid_str = self._uid_cache[user.id] = str(user.id)
 
         # Show typing indicator
         await context.bot.send_chat_action(chat_id=chat_id, action=ChatAction.TYPING)
@@ -78,14 +84,17 @@ class TelegramInterface:
         try:
             response = await self.agent.process_message(
                 user_input=user_input,
-                user_id=str(user.id),
+                user_id=uid_str,
             )
 
             reply = response.text
             if response.actions_taken:
                 reply += f"\n\n_Actions: {', '.join(response.actions_taken)}_"
 
-            # Split long messages
+            # Split long messages, sending chunks in order. Without an
+            # AIORateLimiter on the Application, concurrent reply_text
+            # calls are plain parallel HTTP requests with no per-chat
+            # serialization, so overlapping them could reorder the reply
             for chunk in self._split_message(reply):
                 await update.message.reply_text(chunk, parse_mode="Markdown")
 
@@ -143,7 +152,10 @@ class TelegramInterface:
 
     async def _cmd_memory(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         user = update.effective_user
-        memories = await self.agent.memory.get_all(user_id=str(user.id))
+        uid_str = self._uid_cache.get(user.id)
+        if uid_str is None:
+            uid_str = self._uid_cache[user.id] = str(user.id)
+        memories = await self.agent.memory.get_all(user_id=uid_str)
         if not memories:
             await update.message.reply_text("I don't have any saved memories yet.")
             return
@@ -170,8 +182,6 @@ class TelegramInterface:
         """Split a message into Telegram-sized chunks."""
         if len(text) <= MAX_MESSAGE_LEN:
             return [text]
-        chunks = []
-        while text:
-            chunks.append(text[:MAX_MESSAGE_LEN])
-            text = text[MAX_MESSAGE_LEN:]
-        return chunks
+        # Index-based slicing copies each char once; the old while-loop
+        # re-sliced the remainder every iteration, which is quadratic
+        return [text[i:i + MAX_MESSAGE_LEN] for i in range(0, len(text), MAX_MESSAGE_LEN)]
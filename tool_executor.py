@@ -8,7 +8,10 @@ Handles:
 """
 
 import asyncio
+import itertools
 import logging
+import time
+from collections import deque
 from datetime import datetime
 from typing import Any, Optional
 
@@ -16,6 +19,9 @@ from tools.tool_registry import ToolRegistry
 
 logger = logging.getLogger("MAX.tool_executor")
 
+AUDIT_LOG_MAX = 10_000   # Entries kept in the ring buffer
+AUDIT_ARG_CHARS = 200    # Per-argument repr cap in audit entries
+
 
 class ToolExecutor:
     """
@@ -34,7 +40,32 @@ class ToolExecutor:
         self.registry = tool_registry
         self.confirm_before_action = confirm_before_action
         self.confirm_callback = confirm_callback  # Set by interface layer
-        self.audit_log: list[dict] = []
+        # Bounded ring — a list grew forever in long-running sessions,
+        # retaining every arguments dict (including fetched HTML payloads)
+        self.audit_log: deque = deque(maxlen=AUDIT_LOG_MAX)
+        # Flat dispatch snapshot: tool name -> (action, needs_confirm).
+        # One dict hit per execute() instead of a tools lookup plus a
+        # metadata lookup (with its throwaway {} default) per call
+        self._tool_info: Optional[dict[str, tuple]] = None
+
+    def _snapshot_tool_info(self) -> dict:
+        meta = self.registry._tool_metadata
+        self._tool_info = {
+            name: (action, meta[name]["confirm_required"])
+            for name, action in self.registry.tools.items()
+        }
+        return self._tool_info
+
+    def _lookup_tool(self, tool_name: str):
+        """Resolve a tool from the snapshot, rebuilding it if the registry
+        has discovered new tools since the last snapshot."""
+        info = self._tool_info
+        if info is None:
+            info = self._snapshot_tool_info()
+        entry = info.get(tool_name)
+        if entry is None and tool_name in self.registry.tools:
+            entry = self._snapshot_tool_info().get(tool_name)
+        return entry
 
     async def execute(
         self,
@@ -52,12 +83,13 @@ class ToolExecutor:
             - tool_name: str
             - duration_ms: float
         """
-        tool = self.registry.tools.get(tool_name)
-        if not tool:
+        entry = self._lookup_tool(tool_name)
+        if entry is None:
             return self._error_result(tool_name, f"Unknown tool: '{tool_name}'")
+        tool, needs_confirm = entry
 
         # Check if confirmation needed
-        if self.confirm_before_action and self.registry.requires_confirmation(tool_name):
+        if self.confirm_before_action and needs_confirm:
             confirmed = await self._request_confirmation(tool_name, arguments)
             if not confirmed:
                 return {
@@ -68,19 +100,22 @@ class ToolExecutor:
                     "cancelled": True,
                 }
 
-        # Execute
-        start = datetime.utcnow()
+        # Execute — perf_counter_ns for the duration (monotonic, no
+        # datetime/timedelta allocations), wall clock only for the audit
+        # timestamp
+        start_ns = time.perf_counter_ns()
+        iso_start = datetime.utcnow().isoformat()
         try:
             result = await tool(**arguments)
-            duration = (datetime.utcnow() - start).total_seconds() * 1000
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000
 
             log_entry = {
                 "tool": tool_name,
-                "arguments": arguments,
+                "arguments": self._audit_arguments(arguments),
                 "user_id": user_id,
                 "success": True,
                 "duration_ms": duration,
-                "timestamp": start.isoformat(),
+                "timestamp": iso_start,
             }
             self.audit_log.append(log_entry)
             logger.info(f"Tool '{tool_name}' executed in {duration:.0f}ms")
@@ -94,17 +129,17 @@ class ToolExecutor:
             }
 
         except Exception as e:
-            duration = (datetime.utcnow() - start).total_seconds() * 1000
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000
             logger.error(f"Tool '{tool_name}' failed: {e}", exc_info=True)
 
             self.audit_log.append({
                 "tool": tool_name,
-                "arguments": arguments,
+                "arguments": self._audit_arguments(arguments),
                 "user_id": user_id,
                 "success": False,
                 "error": str(e),
                 "duration_ms": duration,
-                "timestamp": start.isoformat(),
+                "timestamp": iso_start,
             })
 
             return self._error_result(tool_name, str(e), duration)
@@ -129,9 +164,16 @@ class ToolExecutor:
         """Set the confirmation callback from the interface layer."""
         self.confirm_callback = callback
 
+    @staticmethod
+    def _audit_arguments(arguments: dict) -> dict:
+        """Truncated-repr copy of the arguments, so the audit ring never
+        pins large payloads (file contents, page text) in memory."""
+        return {k: repr(v)[:AUDIT_ARG_CHARS] for k, v in arguments.items()}
+
     def get_audit_log(self, limit: int = 50) -> list[dict]:
         """Return recent tool execution history."""
-        return self.audit_log[-limit:]
+        start = max(0, len(self.audit_log) - limit)
+        return list(itertools.islice(self.audit_log, start, None))
 
     @staticmethod
     def _error_result(tool_name: str, error: str, duration_ms: float = 0) -> dict:
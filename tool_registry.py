@@ -5,6 +5,7 @@ Scans the skills/ directory, imports each skill, and maintains
 a unified registry of all callable actions.
 """
 
+import asyncio
 import importlib
 import inspect
 import logging
@@ -30,78 +31,125 @@ class ToolRegistry:
         self.skills: dict[str, BaseSkill] = {}
         self.tools: dict[str, callable] = {}
         self._tool_metadata: dict[str, dict] = {}
+        # Aggregated schema caches — frozen tuples built in one pass over
+        # the skills; None until built, reset whenever discovery runs so a
+        # lookup before/between discoveries can never pin stale data
+        self._descriptions: Optional[tuple] = None
+        self._claude_schemas: Optional[tuple] = None
+        self._openai_schemas: Optional[tuple] = None
+
+    def _load_skill_file(self, skill_file: Path, enabled, load_all: bool) -> list:
+        """
+        Import one skill module and instantiate its enabled skill classes.
+
+        Runs on a worker thread — returns (name, instance) pairs and does
+        NOT touch registry state, so concurrent loads can't race; the
+        caller merges results on the event-loop thread.
+        """
+        module_name = f"skills.{skill_file.stem}"
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            logger.warning(f"Failed to import {module_name}: {e}")
+            return []
+
+        loaded = []
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(obj, BaseSkill) or obj is BaseSkill:
+                continue
 
-    async def discover_skills(self):
-        """Scan skills/ directory and load enabled skill classes."""
-        skills_dir = Path(__file__).parent.parent / "skills"
-        enabled = self.settings.enabled_skills if self.settings else []
-        load_all = "all" in enabled
+            skill_name = getattr(obj, "name", None) or obj.__name__.lower()
 
-        logger.info(f"Discovering skills (enabled: {enabled})...")
-
-        for skill_file in skills_dir.glob("*.py"):
-            if skill_file.name.startswith("_"):
+            if not load_all and skill_name not in enabled:
+                logger.debug(f"Skipping skill '{skill_name}' (not in ENABLED_SKILLS)")
                 continue
 
-            module_name = f"skills.{skill_file.stem}"
             try:
-                module = importlib.import_module(module_name)
+                loaded.append((skill_name, obj(settings=self.settings)))
             except Exception as e:
-                logger.warning(f"Failed to import {module_name}: {e}")
-                continue
-
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if not issubclass(obj, BaseSkill) or obj is BaseSkill:
-                    continue
+                logger.error(f"Failed to initialize skill '{skill_name}': {e}")
+        return loaded
 
-                skill_instance = obj.__new__(obj)
-                skill_name = getattr(skill_instance, "name", None) or obj.__name__.lower()
-
-                if not load_all and skill_name not in enabled:
-                    logger.debug(f"Skipping skill '{skill_name}' (not in ENABLED_SKILLS)")
-                    continue
+    async def discover_skills(self):
+        """Scan skills/ directory and load enabled skill classes."""
+        skills_dir = Path(__file__).parent.parent / "skills"
+        enabled = self.settings.enabled_skills if self.settings else []
+        load_all = "all" in enabled
 
-                try:
-                    skill_instance = obj(settings=self.settings)
-                    self.skills[skill_name] = skill_instance
+        logger.info(f"Discovering skills (enabled: {enabled})...")
 
-                    # Register individual actions
-                    for tool_name, action in skill_instance._actions.items():
-                        self.tools[tool_name] = action
-                        self._tool_metadata[tool_name] = {
-                            "skill": skill_name,
-                            "description": getattr(action, "_action_description", ""),
-                            "confirm_required": getattr(action, "_confirm_required", False),
-                        }
-                        logger.debug(f"Registered tool: {tool_name}")
+        skill_files = [
+            f for f in skills_dir.glob("*.py") if not f.name.startswith("_")
+        ]
+
+        # Imports run concurrently on threads — each skill module pulls in
+        # its own heavy dependencies (httpx, bs4, telegram, ...), and disk
+        # plus extension-module loading releases the GIL, so startup cost
+        # drops from the sum of the imports to roughly the slowest one
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._load_skill_file, f, enabled, load_all)
+              for f in skill_files)
+        )
+
+        for loaded in results:
+            for skill_name, skill_instance in loaded:
+                self.skills[skill_name] = skill_instance
+
+                # Register individual actions
+                for tool_name, action in skill_instance._actions.items():
+                    self.tools[tool_name] = action
+                    self._tool_metadata[tool_name] = {
+                        "skill": skill_name,
+                        "description": getattr(action, "_action_description", ""),
+                        "confirm_required": getattr(action, "_confirm_required", False),
+                    }
+                    logger.debug(f"Registered tool: {tool_name}")
+
+                logger.info(f"✓ Loaded skill '{skill_name}' with {len(skill_instance._actions)} actions")
+
+        self._invalidate_caches()
+        self._build_schema_caches()
+        logger.info(f"Tool discovery complete. {len(self.tools)} tools available across {len(self.skills)} skills.")
 
-                    logger.info(f"✓ Loaded skill '{skill_name}' with {len(skill_instance._actions)} actions")
+    def _invalidate_caches(self):
+        """Reset the aggregated schema caches after the skill set changes."""
+        self._descriptions = None
+        self._claude_schemas = None
+        self._openai_schemas = None
 
-                except Exception as e:
-                    logger.error(f"Failed to initialize skill '{skill_name}': {e}")
+    def _build_schema_caches(self):
+        """One pass over the skills fills all three representations; frozen
+        as tuples so nothing downstream can mutate shared schema state."""
+        descriptions, claude_schemas, openai_schemas = [], [], []
+        for skill in self.skills.values():
+            descriptions.extend(skill.get_tool_descriptions())
+            claude_schemas.extend(skill.get_claude_schemas())
+            openai_schemas.extend(skill.get_openai_schemas())
+        self._descriptions = tuple(descriptions)
+        self._claude_schemas = tuple(claude_schemas)
+        self._openai_schemas = tuple(openai_schemas)
 
-        logger.info(f"Tool discovery complete. {len(self.tools)} tools available across {len(self.skills)} skills.")
+    # The skill set is fixed after discover_skills(), so the aggregates
+    # are built once at the end of discovery and every getter is a
+    # pointer return.
 
-    def get_tool_descriptions(self) -> list[dict]:
+    def get_tool_descriptions(self) -> tuple:
         """Return all tool descriptions for prompt injection."""
-        descriptions = []
-        for skill in self.skills.values():
-            descriptions.extend(skill.get_tool_descriptions())
-        return descriptions
+        if self._descriptions is None:
+            self._build_schema_caches()
+        return self._descriptions
 
-    def get_claude_tool_schemas(self) -> list[dict]:
+    def get_claude_tool_schemas(self) -> tuple:
         """Return all tools in Anthropic Claude format."""
-        schemas = []
-        for skill in self.skills.values():
-            schemas.extend(skill.get_claude_schemas())
-        return schemas
+        if self._claude_schemas is None:
+            self._build_schema_caches()
+        return self._claude_schemas
 
-    def get_openai_tool_schemas(self) -> list[dict]:
+    def get_openai_tool_schemas(self) -> tuple:
         """Return all tools in OpenAI function-calling format."""
-        schemas = []
-        for skill in self.skills.values():
-            schemas.extend(skill.get_openai_schemas())
-        return schemas
+        if self._openai_schemas is None:
+            self._build_schema_caches()
+        return self._openai_schemas
 
     def requires_confirmation(self, tool_name: str) -> bool:
         """Check if a tool requires user confirmation before execution."""
@@ -10,11 +10,20 @@ Capabilities:
 import asyncio
 import logging
 import re
+from collections import OrderedDict
 from typing import Optional
 
 import httpx
 from bs4 import BeautifulSoup
 
+try:
+    # C-backed HTML parser, ~10-25x faster than html.parser for the
+    # strip-boilerplate-and-extract-text pattern used here
+    from selectolax.parser import HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
 from skills.base import BaseSkill, skill_action
 
 logger = logging.getLogger("MAX.skills.web")
@@ -27,6 +36,36 @@ HEADERS = {
     )
 }
 
+FETCH_CACHE_SIZE = 64
+# Stop downloading a page after this many bytes — fetch_url returns a few
+# KB of text, and <article>/<main> sits comfortably inside the first 200 KB
+FETCH_BYTE_CAP = 200_000
+
+# One process-wide client: connection pools and TLS sessions are per-client,
+# so every WebSkill instance sharing this one reuses warm connections, and
+# HTTP/2 multiplexes concurrent fetches to the same host over one socket
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=15.0,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _CLIENT
+
+# Compiled once — re.sub's internal pattern cache still hashes the
+# pattern string on every call
+_MULTI_NEWLINE = re.compile(r"\n{3,}")
+
+BOILERPLATE_TAGS = ("script", "style", "nav", "footer", "header",
+                    "aside", "advertisement", "iframe", "noscript")
+
 
 class WebSkill(BaseSkill):
     name = "web"
@@ -34,11 +73,12 @@ class WebSkill(BaseSkill):
 
     def __init__(self, settings=None):
         super().__init__(settings)
-        self._client = httpx.AsyncClient(
-            headers=HEADERS,
-            timeout=15.0,
-            follow_redirects=True,
-        )
+        self._client = _get_client()
+        # LRU of extracted page text keyed by URL, revalidated with
+        # conditional requests — agents commonly refetch the same page
+        # within a session (read, then summarize, then quote), and the
+        # HTML parse is the expensive part
+        self._fetch_cache: "OrderedDict[str, tuple[Optional[str], Optional[str], str]]" = OrderedDict()
 
     @skill_action(description="Search the web for a query and return top results")
     async def search(self, query: str, max_results: int = 5) -> str:
@@ -80,21 +120,27 @@ class WebSkill(BaseSkill):
             logger.error(f"Search failed: {e}")
             return f"Search failed: {str(e)}"
 
-    @skill_action(description="Fetch the content of a URL and return clean readable text")
-    async def fetch_url(self, url: str, max_chars: int = 3000) -> str:
-        """Fetch a URL and extract readable text content."""
-        try:
-            response = await self._client.get(url)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Remove boilerplate elements
-            for tag in soup(["script", "style", "nav", "footer", "header",
-                              "aside", "advertisement", "iframe", "noscript"]):
+    @staticmethod
+    def _extract_text(html: str) -> str:
+        """Strip boilerplate and return the readable text of a page."""
+        if HAS_SELECTOLAX:
+            tree = HTMLParser(html)
+            for tag_name in BOILERPLATE_TAGS:
+                for node in tree.css(tag_name):
+                    node.decompose()
+            main = (
+                tree.css_first("article") or
+                tree.css_first("main") or
+                tree.css_first("#content") or
+                tree.css_first(".content") or
+                tree.body or
+                tree.root
+            )
+            text = main.text(separator="\n", strip=True) if main else ""
+        else:
+            soup = BeautifulSoup(html, "html.parser")
+            for tag in soup(list(BOILERPLATE_TAGS)):
                 tag.decompose()
-
-            # Extract main content
             main = (
                 soup.find("article") or
                 soup.find("main") or
@@ -102,20 +148,62 @@ class WebSkill(BaseSkill):
                 soup.find(class_="content") or
                 soup.body
             )
-
             if main:
                 text = main.get_text(separator="\n", strip=True)
             else:
                 text = soup.get_text(separator="\n", strip=True)
 
-            # Clean up whitespace
-            text = re.sub(r"\n{3,}", "\n\n", text)
-            text = text[:max_chars]
+        # Clean up whitespace
+        return _MULTI_NEWLINE.sub("\n\n", text)
 
-            if len(response.text) > max_chars:
-                text += f"\n\n[Content truncated. Full page: {url}]"
+    @staticmethod
+    def _format_fetch(url: str, text: str, max_chars: int) -> str:
+        if len(text) > max_chars:
+            return f"Content from {url}:\n\n{text[:max_chars]}\n\n[Content truncated. Full page: {url}]"
+        return f"Content from {url}:\n\n{text}"
 
-            return f"Content from {url}:\n\n{text}"
+    @skill_action(description="Fetch the content of a URL and return clean readable text")
+    async def fetch_url(self, url: str, max_chars: int = 3000) -> str:
+        """Fetch a URL and extract readable text content."""
+        try:
+            cached = self._fetch_cache.get(url)
+            headers = {}
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+            # Stream with a byte cap: a multi-megabyte page otherwise gets
+            # fully downloaded, decoded, and parsed for ~3 KB of output
+            async with self._client.stream("GET", url, headers=headers or None) as response:
+                # 304 — the page hasn't changed; skip the parse entirely
+                if response.status_code == 304 and cached:
+                    self._fetch_cache.move_to_end(url)
+                    return self._format_fetch(url, cached[2], max_chars)
+
+                response.raise_for_status()
+                buf = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buf.extend(chunk)
+                    if len(buf) >= FETCH_BYTE_CAP:
+                        break
+
+            html = bytes(buf).decode(response.encoding or "utf-8", errors="replace")
+            text = self._extract_text(html)
+
+            # Only cache pages that offer a validator — anything else
+            # would have to be refetched in full regardless
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+            if etag or last_modified:
+                self._fetch_cache[url] = (etag, last_modified, text)
+                self._fetch_cache.move_to_end(url)
+                while len(self._fetch_cache) > FETCH_CACHE_SIZE:
+                    self._fetch_cache.popitem(last=False)
+
+            return self._format_fetch(url, text, max_chars)
 
         except httpx.HTTPStatusError as e:
             return f"HTTP error {e.response.status_code} fetching {url}"
@@ -123,31 +211,59 @@ class WebSkill(BaseSkill):
             logger.error(f"Fetch failed for {url}: {e}")
             return f"Failed to fetch {url}: {str(e)}"
 
+    @skill_action(description="Fetch multiple URLs concurrently and return their extracted texts")
+    async def fetch_urls(self, urls: list[str], max_chars_each: int = 1500) -> str:
+        """
+        Fetch several URLs in parallel — the 'search then read the top N
+        results' pattern costs max(RTT) instead of sum(RTT).
+        """
+        if not urls:
+            return "No URLs given"
+
+        results = await asyncio.gather(
+            *(self.fetch_url(u, max_chars_each) for u in urls),
+            return_exceptions=True,
+        )
+        return "\n\n---\n\n".join(str(r) for r in results)
+
     @skill_action(description="Get the title and meta description of a URL without downloading full content")
     async def peek_url(self, url: str) -> str:
         """Quick peek at a URL — just title and description."""
         try:
-            response = await self._client.head(url)
-            # Some servers don't support HEAD — fall back to GET with short read
-            if response.status_code == 405:
-                response = await self._client.get(url)
-
-            response = await self._client.get(url)
-            soup = BeautifulSoup(response.text[:10000], "html.parser")
-
-            title = soup.find("title")
-            description = (
-                soup.find("meta", attrs={"name": "description"}) or
-                soup.find("meta", attrs={"property": "og:description"})
-            )
-
-            title_text = title.get_text(strip=True) if title else "No title"
-            desc_text = description.get("content", "No description") if description else "No description"
+            # One ranged GET instead of HEAD-then-GET: the old flow issued
+            # an unconditional second GET even when HEAD succeeded, and
+            # HEAD couldn't return the title/meta anyway. Servers that
+            # honor Range send only the first 10 KB (206); those that
+            # don't return the full page, which the slice below caps.
+            response = await self._client.get(url, headers={"Range": "bytes=0-9999"})
+            head_html = response.text[:10000]
+
+            if HAS_SELECTOLAX:
+                tree = HTMLParser(head_html)
+                title = tree.css_first("title")
+                description = (
+                    tree.css_first('meta[name="description"]') or
+                    tree.css_first('meta[property="og:description"]')
+                )
+                title_text = title.text(strip=True) if title else "No title"
+                desc_text = description.attributes.get("content") if description else None
+            else:
+                soup = BeautifulSoup(head_html, "html.parser")
+                title = soup.find("title")
+                description = (
+                    soup.find("meta", attrs={"name": "description"}) or
+                    soup.find("meta", attrs={"property": "og:description"})
+                )
+                title_text = title.get_text(strip=True) if title else "No title"
+                desc_text = description.get("content") if description else None
 
-            return f"URL: {url}\nTitle: {title_text}\nDescription: {desc_text}"
+            return f"URL: {url}\nTitle: {title_text}\nDescription: {desc_text or 'No description'}"
 
         except Exception as e:
             return f"Could not peek at {url}: {str(e)}"
 
     async def close(self):
-        await self._client.aclose()
+        global _CLIENT
+        if _CLIENT is not None:
+            await _CLIENT.aclose()
+            _CLIENT = None